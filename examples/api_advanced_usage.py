@@ -9,6 +9,8 @@ Run with:
     python -m examples.api_advanced_usage
 """
 
+import sys
+
 from splurge_pub_sub import (
     Message,
     PubSub,
@@ -51,10 +53,8 @@ def example_1_basic_aggregator() -> None:
     print("2. Publishing from pack_c_bus")
     pack_c_bus.publish("user.created", {"id": 2, "source": "pack-c"})
 
-    # Drain all buses to ensure messages are forwarded and delivered
-    pack_b_bus.drain()
-    pack_c_bus.drain()
-    aggregator.drain()
+    # Drain managed buses and the aggregator to ensure messages are forwarded and delivered
+    aggregator.drain(cascade=True)
 
     print(f"\n3. Total events received: {len(received_events)}")
     print("   ✓ Messages from both PubSub instances were aggregated")
@@ -88,15 +88,13 @@ def example_2_dynamic_add_remove() -> None:
     print("\n1. Adding bus_a to aggregator")
     aggregator.add_pubsub(bus_a)
     bus_a.publish("event.topic", {"source": "bus_a", "step": 1})
-    bus_a.drain()
-    aggregator.drain()
+    aggregator.drain(cascade=True)
 
     # Add bus_b
     print("\n2. Adding bus_b to aggregator")
     aggregator.add_pubsub(bus_b)
     bus_b.publish("event.topic", {"source": "bus_b", "step": 2})
-    bus_b.drain()
-    aggregator.drain()
+    aggregator.drain(cascade=True)
 
     # Remove bus_a
     print("\n3. Removing bus_a from aggregator")
@@ -108,8 +106,7 @@ def example_2_dynamic_add_remove() -> None:
     # bus_b still works
     print("\n4. Publishing from remaining bus_b")
     bus_b.publish("event.topic", {"source": "bus_b", "step": 4})
-    bus_b.drain()
-    aggregator.drain()
+    aggregator.drain(cascade=True)
 
     print(f"\n5. Total events received: {len(received)}")
     print("   ✓ Only messages from active PubSub instances were received")
@@ -267,20 +264,16 @@ def example_5_one_way_message_flow() -> None:
     # Publish from managed PubSub instances (forwarded to aggregator)
     print("\n1. Publishing from pack_b_bus:")
     pack_b_bus.publish("event.topic", {"source": "pack-b"})
-    pack_b_bus.drain()
-    aggregator.drain()
+    aggregator.drain(cascade=True)
 
     print("\n2. Publishing from pack_c_bus:")
     pack_c_bus.publish("event.topic", {"source": "pack-c"})
-    pack_c_bus.drain()
-    aggregator.drain()
+    aggregator.drain(cascade=True)
 
     # Publish from aggregator (NOT forwarded to managed instances)
     print("\n3. Publishing from aggregator:")
     aggregator.publish("event.topic", {"source": "aggregator"})
-    aggregator.drain()
-    pack_b_bus.drain()
-    pack_c_bus.drain()
+    aggregator.drain(cascade=True)
 
     print("\n4. Summary:")
     print(f"   Aggregator received: {len(received_aggregator)} messages")
@@ -308,8 +301,11 @@ def example_6_real_world_scenario() -> None:
     # Central monitoring aggregator
     monitoring_aggregator = PubSubAggregator(pubsubs=[database_bus, api_bus, cache_bus])
 
-    # Central event logger
+    # Central event logger. The handler only records; output is buffered and
+    # written once per batch after draining, keeping stdout I/O off the
+    # dispatch path.
     all_events: list[dict] = []
+    log_lines: list[str] = []
 
     def log_event(msg: Message) -> None:
         """Central logging for all events."""
@@ -317,34 +313,46 @@ def example_6_real_world_scenario() -> None:
             "topic": msg.topic,
             "data": msg.data,
             "correlation_id": msg.correlation_id,
-            "timestamp": msg.timestamp.isoformat(),
+            "timestamp": msg.timestamp_iso(),
         }
         all_events.append(event_info)
-        print(f"  📝 [{event_info['topic']}] {event_info['data']}")
+        log_lines.append(f"  📝 [{event_info['topic']}] {event_info['data']}")
+
+    def flush_log() -> None:
+        """Write buffered log lines in one call."""
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
+            log_lines.clear()
 
     # Subscribe to all events
     monitoring_aggregator.subscribe("*", log_event, correlation_id="*")
 
-    # Simulate events from different packages
-    print("\n1. Simulating database events:")
-    database_bus.publish("db.connection.opened", {"pool_size": 10})
-    database_bus.publish("db.query.executed", {"query": "SELECT * FROM users", "duration_ms": 45})
-    database_bus.drain()
-
-    print("\n2. Simulating API events:")
-    api_bus.publish("api.request.received", {"method": "GET", "path": "/users"})
-    api_bus.publish("api.response.sent", {"status_code": 200, "duration_ms": 120})
-    api_bus.drain()
-
-    print("\n3. Simulating cache events:")
-    cache_bus.publish("cache.hit", {"key": "user:123", "ttl": 3600})
-    cache_bus.publish("cache.miss", {"key": "user:456"})
-    cache_bus.drain()
-
-    # Drain aggregator to ensure all forwarded messages are processed
-    monitoring_aggregator.drain()
-
-    print(f"\n4. Total events logged: {len(all_events)}")
+    # Simulate events from different packages; the three buses dispatch concurrently
+    print("\n1. Simulating database, API and cache events:")
+    database_bus.publish_many(
+        [
+            ("db.connection.opened", {"pool_size": 10}),
+            ("db.query.executed", {"query": "SELECT * FROM users", "duration_ms": 45}),
+        ]
+    )
+    api_bus.publish_many(
+        [
+            ("api.request.received", {"method": "GET", "path": "/users"}),
+            ("api.response.sent", {"status_code": 200, "duration_ms": 120}),
+        ]
+    )
+    cache_bus.publish_many(
+        [
+            ("cache.hit", {"key": "user:123", "ttl": 3600}),
+            ("cache.miss", {"key": "user:456"}),
+        ]
+    )
+
+    # One cascaded drain gathers everything (arrival order across packages may vary)
+    monitoring_aggregator.drain(cascade=True)
+    flush_log()
+
+    print(f"\n2. Total events logged: {len(all_events)}")
     print("   ✓ All events from different packages were aggregated")
     print("   ✓ Central monitoring received events from all sources")
 
@@ -10,6 +10,8 @@ Run with:
     python -m examples.api_solo_usage
 """
 
+import sys
+
 from splurge_pub_sub import (
     Message,
     PubSubAggregator,
@@ -27,8 +29,7 @@ def example_1_basic_singleton() -> None:
     print("=" * 70)
 
     # Reset any existing instances for clean example state
-    for scope in PubSubSolo.get_all_scopes():
-        PubSubSolo.shutdown(scope=scope)
+    PubSubSolo.shutdown_all()
 
     print("\n1. Getting singleton instance for 'package_a'")
     bus_a = PubSubSolo.get_instance(scope="package_a")
@@ -53,8 +54,7 @@ def example_2_multiple_packages() -> None:
     print("=" * 70)
 
     # Reset any existing instances for clean example state
-    for scope in PubSubSolo.get_all_scopes():
-        PubSubSolo.shutdown(scope=scope)
+    PubSubSolo.shutdown_all()
 
     print("\n1. Simulating package_a")
     bus_a = PubSubSolo.get_instance(scope="package_a")
@@ -107,8 +107,7 @@ def example_3_aggregation() -> None:
     print("=" * 70)
 
     # Reset any existing instances for clean example state
-    for scope in PubSubSolo.get_all_scopes():
-        PubSubSolo.shutdown(scope=scope)
+    PubSubSolo.shutdown_all()
 
     print("\n1. Creating singleton instances for different packages")
     dsv_bus = PubSubSolo.get_instance(scope="splurge_dsv")
@@ -141,11 +140,8 @@ def example_3_aggregation() -> None:
     tabular_bus.publish("tabular.table.created", {"rows": 100})
     typer_bus.publish("typer.command.executed", {"command": "process"})
 
-    # Drain all buses
-    dsv_bus.drain()
-    tabular_bus.drain()
-    typer_bus.drain()
-    monitoring_aggregator.drain()
+    # Drain all buses (managed buses first, then the aggregator)
+    monitoring_aggregator.drain(cascade=True)
 
     print(f"\n5. Total events logged: {len(all_events)}")
     print("   ✓ All events from different packages were aggregated")
@@ -161,8 +157,7 @@ def example_4_convenience_methods() -> None:
     print("=" * 70)
 
     # Reset any existing instances for clean example state
-    for scope in PubSubSolo.get_all_scopes():
-        PubSubSolo.shutdown(scope=scope)
+    PubSubSolo.shutdown_all()
 
     received: list[Message] = []
 
@@ -197,8 +192,7 @@ def example_5_real_world_scenario() -> None:
     print("=" * 70)
 
     # Reset any existing instances for clean example state
-    for scope in PubSubSolo.get_all_scopes():
-        PubSubSolo.shutdown(scope=scope)
+    PubSubSolo.shutdown_all()
 
     # Simulate PubSubSolo instances from different packages
     database_bus = PubSubSolo.get_instance(scope="database_package")
@@ -208,41 +202,57 @@ def example_5_real_world_scenario() -> None:
     # Central monitoring aggregator
     monitoring_aggregator = PubSubAggregator(pubsubs=[database_bus, api_bus, cache_bus])
 
-    # Central event logger
+    # Central event logger. The handler only records; output is buffered and
+    # written once per batch after draining, keeping stdout I/O off the
+    # dispatch path.
     all_events: list[dict] = []
+    log_lines: list[str] = []
 
     def log_event(msg: Message) -> None:
         """Central logging for all events."""
         event_info = {
             "topic": msg.topic,
             "data": msg.data,
-            "timestamp": msg.timestamp.isoformat(),
+            "timestamp": msg.timestamp_iso(),
         }
         all_events.append(event_info)
-        print(f"  📝 [{event_info['topic']}] {event_info['data']}")
+        log_lines.append(f"  📝 [{event_info['topic']}] {event_info['data']}")
+
+    def flush_log() -> None:
+        """Write buffered log lines in one call."""
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
+            log_lines.clear()
 
     # Subscribe to all events
     monitoring_aggregator.subscribe("*", log_event, correlation_id="*")
 
-    print("\n1. Simulating database events:")
-    database_bus.publish("db.connection.opened", {"pool_size": 10})
-    database_bus.publish("db.query.executed", {"query": "SELECT * FROM users", "duration_ms": 45})
-    database_bus.drain()
-
-    print("\n2. Simulating API events:")
-    api_bus.publish("api.request.received", {"method": "GET", "path": "/users"})
-    api_bus.publish("api.response.sent", {"status_code": 200, "duration_ms": 120})
-    api_bus.drain()
-
-    print("\n3. Simulating cache events:")
-    cache_bus.publish("cache.hit", {"key": "user:123", "ttl": 3600})
-    cache_bus.publish("cache.miss", {"key": "user:456"})
-    cache_bus.drain()
-
-    # Drain aggregator to ensure all forwarded messages are processed
-    monitoring_aggregator.drain()
-
-    print(f"\n4. Total events logged: {len(all_events)}")
+    # Each package publishes its batch; the three buses dispatch concurrently
+    print("\n1. Simulating database, API and cache events:")
+    database_bus.publish_many(
+        [
+            ("db.connection.opened", {"pool_size": 10}),
+            ("db.query.executed", {"query": "SELECT * FROM users", "duration_ms": 45}),
+        ]
+    )
+    api_bus.publish_many(
+        [
+            ("api.request.received", {"method": "GET", "path": "/users"}),
+            ("api.response.sent", {"status_code": 200, "duration_ms": 120}),
+        ]
+    )
+    cache_bus.publish_many(
+        [
+            ("cache.hit", {"key": "user:123", "ttl": 3600}),
+            ("cache.miss", {"key": "user:456"}),
+        ]
+    )
+
+    # One cascaded drain gathers everything (arrival order across packages may vary)
+    monitoring_aggregator.drain(cascade=True)
+    flush_log()
+
+    print(f"\n2. Total events logged: {len(all_events)}")
     print("   ✓ All events from different packages were aggregated")
     print("   ✓ Central monitoring received events from all sources")
 
@@ -16,14 +16,11 @@ import sys
 from . import __version__
 
 
-def main(args: list[str] | None = None) -> int:
-    """Main entry point for the command-line interface.
-
-    Args:
-        args: Command-line arguments (defaults to sys.argv[1:]).
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command-line interface.
 
     Returns:
-        int: Exit code (0 for success).
+        argparse.ArgumentParser: Configured parser.
     """
     parser = argparse.ArgumentParser(
         prog="splurge-pub-sub",
@@ -37,11 +34,27 @@ def main(args: list[str] | None = None) -> int:
         version=f"splurge-pub-sub {__version__}",
     )
 
+    return parser
+
+
+# Built once; parse_args() does not mutate the parser, so it is safe to reuse
+_PARSER = _build_parser()
+
+
+def main(args: list[str] | None = None) -> int:
+    """Main entry point for the command-line interface.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        int: Exit code (0 for success).
+    """
     # Parse arguments (validates syntax)
-    parser.parse_args(args)
+    _PARSER.parse_args(args)
 
     # If no command specified, show help
-    parser.print_help()
+    _PARSER.print_help()
     return 0
 
 
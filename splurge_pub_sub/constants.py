@@ -26,7 +26,8 @@ to enable future wildcard pattern matching in Phase 2+.
 
 DEFAULT_UUID_VERSION: int = 4
 """
-UUID version used for generating subscriber IDs.
+UUID version used for generating correlation IDs.
 
 Version 4 UUIDs are randomly generated and suitable for this use case.
+Subscriber IDs are sequence-based and do not use UUIDs.
 """
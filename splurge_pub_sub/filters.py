@@ -14,7 +14,7 @@ DOMAINS: ["filters", "pattern-matching"]
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .exceptions import SplurgePubSubPatternError
 
@@ -22,6 +22,16 @@ __all__ = ["TopicPattern"]
 
 DOMAINS = ["filters", "pattern-matching"]
 
+_WILDCARD_REGEX = {
+    "*": "[^.]*",  # any characters within one segment
+    "?": "[^.]",  # exactly one character within a segment
+}
+
+_WILDCARD_SPLIT_RE = re.compile(r"([*?])")
+
+_MATCH_CACHE_MAX_SIZE = 4096
+"""Maximum number of cached topic match results per TopicPattern."""
+
 
 @dataclass(frozen=True)
 class TopicPattern:
@@ -56,6 +66,8 @@ class TopicPattern:
     pattern: str
     _regex: re.Pattern[str] = None  # type: ignore[assignment]
     _is_exact: bool = None  # type: ignore[assignment]
+    # topic -> match result (hits and misses), bounded by _MATCH_CACHE_MAX_SIZE
+    _match_cache: dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate pattern and compile regex."""
@@ -92,28 +104,12 @@ class TopicPattern:
 
         Example:
             "user.*" -> "^user\\.[^.]*$"
-            "order.?.paid" -> "^order\\.[^.].paid$"
+            "order.?.paid" -> "^order\\.[^.]\\.paid$"
         """
-        # Use placeholder to handle wildcards before escaping
-        # Replace wildcards with unique placeholders
-        temp_pattern = self.pattern.replace("*", "\x00STAR\x00")
-        temp_pattern = temp_pattern.replace("?", "\x00QUEST\x00")
-
-        # Escape special regex chars (except our placeholders)
-        escaped = ""
-        for char in temp_pattern:
-            if char in ".+^$()[]{}|:":
-                escaped += "\\" + char
-            elif char == "\x00":
-                escaped += char  # Keep placeholder markers
-            else:
-                escaped += char
-
-        # Replace placeholders with regex equivalents
-        # * matches any chars except dot (one segment)
-        regex_pattern = escaped.replace("\x00STAR\x00", "[^.]*")
-        # ? matches any single char except dot
-        regex_pattern = regex_pattern.replace("\x00QUEST\x00", "[^.]")
+        # Split around wildcards (keeping them), escape the literal runs and
+        # substitute the wildcard regex equivalents
+        parts = _WILDCARD_SPLIT_RE.split(self.pattern)
+        regex_pattern = "".join(_WILDCARD_REGEX.get(part) or re.escape(part) for part in parts)
 
         # Anchor to start and end for exact matching
         regex_pattern = f"^{regex_pattern}$"
@@ -141,8 +137,22 @@ class TopicPattern:
         if not topic:
             return False
 
-        match_result = self._regex.match(topic)
-        return match_result is not None
+        # Exact patterns are a plain string compare; no regex or cache needed
+        if self._is_exact:
+            return topic == self.pattern
+
+        cache = self._match_cache
+        cached = cache.get(topic)
+        if cached is not None:
+            return cached
+
+        result = self._regex.match(topic) is not None
+        # Bounded: reset rather than evict entry-by-entry, which stays safe
+        # without a lock when the pattern is shared between threads
+        if len(cache) >= _MATCH_CACHE_MAX_SIZE:
+            cache.clear()
+        cache[topic] = result
+        return result
 
     @property
     def is_exact(self) -> bool:
@@ -8,8 +8,10 @@ Domains:
     - message
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+import time
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from .exceptions import SplurgePubSubTypeError, SplurgePubSubValueError
 from .types import MessageData, Metadata, Topic
@@ -20,7 +22,50 @@ DOMAINS = ["pubsub", "message"]
 __all__ = ["Message"]
 
 
-@dataclass(frozen=True)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Marks omitted data/metadata arguments; an explicit None is still validated.
+_MISSING: Any = object()
+
+
+def _validate_fields(topic: Any, data: Any, correlation_id: str | None) -> None:
+    """Validate Message constructor arguments.
+
+    Works on the raw arguments (locals) rather than instance attributes, and
+    runs once per message before any field is set.
+
+    Raises:
+        SplurgePubSubValueError: If topic is invalid or correlation_id is invalid
+        SplurgePubSubTypeError: If data is not dict or keys are not strings
+    """
+    # Validate topic
+    if not topic or not isinstance(topic, str):
+        raise SplurgePubSubValueError(f"Topic must be a non-empty string, got: {topic!r}")
+
+    # Disallow double dots in topic
+    if ".." in topic:
+        raise SplurgePubSubValueError(f"Topic cannot contain consecutive dots: {topic!r}")
+
+    # Disallow leading/trailing dots
+    if topic[0] == "." or topic[-1] == ".":
+        raise SplurgePubSubValueError(f"Topic cannot start or end with dot: {topic!r}")
+
+    # Validate data is a dict
+    if not isinstance(data, dict):
+        raise SplurgePubSubTypeError(f"Message data must be dict[str, Any], got: {type(data).__name__}")
+
+    # Validate all keys are strings
+    for key in data:
+        if not isinstance(key, str):
+            raise SplurgePubSubTypeError(
+                f"Message data keys must be strings, got key {key!r} of type {type(key).__name__}"
+            )
+
+    # Validate correlation_id if provided
+    if correlation_id is not None:
+        validate_correlation_id(correlation_id)
+
+
 class Message:
     """Immutable message published to the pub-sub system.
 
@@ -32,7 +77,14 @@ class Message:
     - Metadata dict (defaults to empty dict if not provided)
 
     Messages are frozen (immutable) to ensure consistency when passed to
-    multiple subscribers.
+    multiple subscribers. Instances use ``__slots__`` (no per-instance
+    ``__dict__``) to keep per-publish allocation small. Message is not a
+    dataclass, so ``dataclasses.replace()``/``asdict()`` do not apply.
+
+    The creation time is captured as integer nanoseconds (``time.time_ns()``);
+    the ``timestamp`` datetime is only built when it is first read, so
+    publishers and subscribers that never look at it do not pay for it; later
+    reads return the same object.
 
     Attributes:
         topic: Topic identifier (uses dot notation, e.g., "user.created")
@@ -60,54 +112,139 @@ class Message:
         {}
     """
 
+    __slots__ = ("topic", "data", "correlation_id", "metadata", "_timestamp", "_timestamp_ns")
+    __match_args__ = ("topic", "data", "correlation_id", "timestamp", "metadata")
+
     topic: Topic
     """Topic identifier for message routing."""
 
-    data: MessageData = field(default_factory=dict)
+    data: MessageData
     """Message payload (defaults to empty dict if not provided)."""
 
-    correlation_id: str | None = None
+    correlation_id: str | None
     """Optional correlation ID for cross-library event tracking (defaults to None)."""
 
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    """UTC timestamp of message creation (auto-generated if not provided)."""
-
-    metadata: Metadata = field(default_factory=dict)
+    metadata: Metadata
     """Metadata dictionary for additional context (defaults to empty dict)."""
 
-    def __post_init__(self) -> None:
-        """Validate message fields after initialization.
+    _timestamp: datetime | None
+    _timestamp_ns: int
+
+    def __init__(
+        self,
+        topic: Topic,
+        data: MessageData = _MISSING,
+        correlation_id: str | None = None,
+        timestamp: datetime | None = None,
+        metadata: Metadata = _MISSING,
+    ) -> None:
+        """Initialize and validate the message.
+
+        Args:
+            topic: Topic identifier (uses dot notation, e.g., "user.created")
+            data: Message payload. Defaults to empty dict if not provided.
+            correlation_id: Optional correlation ID for event tracking
+            timestamp: Optional explicit timestamp. Defaults to the current UTC time.
+            metadata: Optional metadata dictionary. Defaults to empty dict if not provided.
 
         Raises:
             SplurgePubSubValueError: If topic is invalid or correlation_id is invalid
             SplurgePubSubTypeError: If data is not dict or keys are not strings
         """
-        # Validate topic
-        if not self.topic or not isinstance(self.topic, str):
-            raise SplurgePubSubValueError(f"Topic must be a non-empty string, got: {self.topic!r}")
+        if data is _MISSING:
+            data = {}
+        if metadata is _MISSING:
+            metadata = {}
+
+        # Validate the arguments before any field is set
+        _validate_fields(topic, data, correlation_id)
+
+        _set_topic(self, topic)
+        _set_data(self, data)
+        _set_correlation_id(self, correlation_id)
+        _set_metadata(self, metadata)
+        if timestamp is None:
+            _set_timestamp(self, None)
+            _set_timestamp_ns(self, time.time_ns())
+        else:
+            _set_timestamp(self, timestamp)
+            aware = timestamp if timestamp.tzinfo is not None else timestamp.astimezone()
+            _set_timestamp_ns(self, (aware - _EPOCH) // timedelta(microseconds=1) * 1000)
 
-        # Disallow double dots in topic
-        if ".." in self.topic:
-            raise SplurgePubSubValueError(f"Topic cannot contain consecutive dots: {self.topic!r}")
+    @property
+    def timestamp(self) -> datetime:
+        """UTC timestamp of message creation (auto-generated if not provided).
+
+        Built from the captured nanosecond clock value on first access (then
+        memoized), truncated to microseconds like ``datetime.now()``.
+        """
+        timestamp = self._timestamp
+        if timestamp is None:
+            timestamp = _EPOCH + timedelta(microseconds=self._timestamp_ns // 1000)
+            _set_timestamp(self, timestamp)
+        return timestamp
 
-        # Disallow leading/trailing dots
-        if self.topic.startswith(".") or self.topic.endswith("."):
-            raise SplurgePubSubValueError(f"Topic cannot start or end with dot: {self.topic!r}")
+    @property
+    def timestamp_ns(self) -> int:
+        """Creation time as integer nanoseconds since the Unix epoch."""
+        return self._timestamp_ns
 
-        # Validate data is a dict
-        if not isinstance(self.data, dict):
-            raise SplurgePubSubTypeError(f"Message data must be dict[str, Any], got: {type(self.data).__name__}")
+    def timestamp_iso(self) -> str:
+        """Return the timestamp as an ISO 8601 string.
 
-        # Validate all keys are strings
-        for key in self.data.keys():
-            if not isinstance(key, str):
-                raise SplurgePubSubTypeError(
-                    f"Message data keys must be strings, got key {key!r} of type {type(key).__name__}"
-                )
+        Equivalent to ``self.timestamp.isoformat()`` but, for auto-generated
+        timestamps, formatted directly from the nanosecond clock value without
+        constructing a ``datetime``.
 
-        # Validate correlation_id if provided
-        if self.correlation_id is not None:
-            validate_correlation_id(self.correlation_id)
+        Returns:
+            ISO 8601 timestamp string
+
+        Example:
+            >>> msg = Message(topic="user.created")
+            >>> msg.timestamp_iso() == msg.timestamp.isoformat()
+            True
+        """
+        if self._timestamp is not None:
+            return self._timestamp.isoformat()
+        seconds, micros = divmod(self._timestamp_ns // 1000, 1_000_000)
+        base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        if micros:
+            return f"{base}.{micros:06d}+00:00"
+        return f"{base}+00:00"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment (messages are immutable).
+
+        Raises:
+            FrozenInstanceError: Always
+        """
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion (messages are immutable).
+
+        Raises:
+            FrozenInstanceError: Always
+        """
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def _key(self) -> tuple[Any, ...]:
+        """Return the field values used for equality, hashing and pickling."""
+        return (self.topic, self.data, self.correlation_id, self.timestamp, self.metadata)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare messages field by field."""
+        if not isinstance(other, Message):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Hash the message fields (fails if data or metadata is unhashable)."""
+        return hash(self._key())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling and copying despite the frozen ``__setattr__``."""
+        return (self.__class__, self._key())
 
     def __repr__(self) -> str:
         """Return a readable representation of the message.
@@ -117,9 +254,41 @@ class Message:
             >>> repr(msg)
             "Message(topic='test.topic', data={'key': 'value'}, ...)"
         """
-        timestamp_str = self.timestamp.isoformat()
+        timestamp_str = self.timestamp_iso()
         correlation_id_str = f", correlation_id={self.correlation_id!r}" if self.correlation_id is not None else ""
         return (
             f"Message(topic={self.topic!r}, data={self.data!r}"
             f"{correlation_id_str}, timestamp={timestamp_str!r}, metadata={self.metadata!r})"
         )
+
+
+# Slot setters used by Message.__init__ to bypass the frozen __setattr__.
+# Calling the slot descriptors directly is cheaper than object.__setattr__,
+# which has to look the attribute up by name on every call.
+_set_topic = Message.__dict__["topic"].__set__
+_set_data = Message.__dict__["data"].__set__
+_set_correlation_id = Message.__dict__["correlation_id"].__set__
+_set_metadata = Message.__dict__["metadata"].__set__
+_set_timestamp = Message.__dict__["_timestamp"].__set__
+_set_timestamp_ns = Message.__dict__["_timestamp_ns"].__set__
+
+
+def _build_message(topic: Topic, data: MessageData, correlation_id: str, metadata: Metadata) -> Message:
+    """Build a Message whose correlation_id the caller has already validated.
+
+    Used by PubSub.publish() and publish_many(), which resolve the
+    correlation_id (validating it only the first time the bus sees it)
+    before building messages. Topic and data are validated exactly as
+    Message() would; the result is indistinguishable from a Message() built
+    with the same arguments.
+    """
+    _validate_fields(topic, data, None)
+
+    message: Message = object.__new__(Message)
+    _set_topic(message, topic)
+    _set_data(message, data)
+    _set_correlation_id(message, correlation_id)
+    _set_metadata(message, metadata)
+    _set_timestamp(message, None)
+    _set_timestamp_ns(message, time.time_ns())
+    return message
@@ -7,13 +7,13 @@ Domains:
     - pubsub
 """
 
+import itertools
 import logging
-import queue
+import sys
 import threading
-import time
+from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
-from uuid import uuid4
 
 from .errors import ErrorHandler
 from .exceptions import (
@@ -22,11 +22,13 @@ from .exceptions import (
     SplurgePubSubTypeError,
     SplurgePubSubValueError,
 )
-from .message import Message
+from .message import Message, _build_message, _validate_fields
 from .types import Callback, MessageData, Metadata, SubscriberId, Topic
 from .utility import generate_correlation_id, validate_correlation_id
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .decorators import TopicDecorator
 
 DOMAINS = ["pubsub"]
@@ -35,8 +37,18 @@ __all__ = ["PubSub"]
 
 logger = logging.getLogger(__name__)
 
+_ROUTE_CACHE_MAX_SIZE = 10_000
+"""Maximum number of topics whose resolved subscriber tuples are cached."""
+
+_ROUTE_CACHE_MAX_CORRELATION_IDS = 64
+"""Maximum number of correlation_ids with a cached route per topic."""
+
+# Process-wide sequence for subscriber IDs, so IDs are unique across buses
+# (e.g. those managed by a PubSubAggregator). next() on a count is atomic.
+_subscriber_sequence = itertools.count(1)
+
 
-@dataclass
+@dataclass(slots=True)
 class _SubscriberEntry:
     """Internal representation of a subscriber."""
 
@@ -57,7 +69,8 @@ class PubSub:
         All operations are thread-safe using an RLock for synchronization.
         The lock is held only during critical sections (subscription registry
         updates), allowing subscribers to publish during callbacks without
-        deadlock.
+        deadlock. Subscriber collections are immutable tuples replaced on
+        change, so publishing and dispatch read them without taking the lock.
 
     Example:
         >>> bus = PubSub()
@@ -144,8 +157,14 @@ class PubSub:
         from .errors import default_error_handler
 
         self._lock: threading.RLock = threading.RLock()
-        self._subscribers: dict[Topic, list[_SubscriberEntry]] = {}
-        self._wildcard_subscribers: list[_SubscriberEntry] = []
+        # Subscriber collections are immutable tuples replaced on every change
+        # (copy-on-write), so dispatch can use them without copying
+        self._subscribers: dict[Topic, tuple[_SubscriberEntry, ...]] = {}
+        self._wildcard_subscribers: tuple[_SubscriberEntry, ...] = ()
+        # topic -> correlation_id -> callbacks of the topic and wildcard
+        # subscribers whose correlation_id filter accepts it, built on first
+        # dispatch and invalidated whenever either subscriber collection changes
+        self._route_cache: dict[Topic, dict[str | None, tuple[Callback, ...]]] = {}
         self._is_shutdown: bool = False
         self._error_handler: ErrorHandler = error_handler or default_error_handler
 
@@ -161,19 +180,18 @@ class PubSub:
         # Initialize correlation_ids set with instance correlation_id
         self._correlation_ids: set[str] = {self._correlation_id}
 
-        # Queue infrastructure for async message dispatch
-        self._message_queue: queue.Queue[Message] = queue.Queue()
-        self._worker_thread: threading.Thread | None = None
+        # Queue infrastructure for async message dispatch.
+        # deque.append()/popleft() are atomic, so publishers never take a lock to
+        # enqueue; they only set the wakeup event when the worker is waiting on it.
+        self._message_queue: deque[Message] = deque()
+        self._worker_wakeup = threading.Event()
+        self._worker_idle: bool = True
+        self._idle_condition = threading.Condition(threading.Lock())
         self._worker_stop_event = threading.Event()
 
-        # Start worker thread
-        self._worker_thread = threading.Thread(
-            target=self._worker_loop,
-            name="PubSub-Worker",
-            daemon=True,
-        )
-        self._worker_thread.start()
-        logger.debug("PubSub worker thread started")
+        # Worker thread is started on the first enqueue, so buses that are only
+        # subscribed to (or never used) do not hold a thread
+        self._worker_thread: threading.Thread | None = None
 
     def subscribe(
         self,
@@ -187,6 +205,9 @@ class PubSub:
         The callback will be invoked for each message published to the topic.
         Multiple subscribers can subscribe to the same topic.
 
+        The bus holds a strong reference to the callback (including a bound
+        method's instance) until it is unsubscribed, cleared or the bus shuts down.
+
         Args:
             topic: Topic identifier (uses dot notation, e.g., "user.created") or "*" for all topics
             callback: Callable that accepts a Message and returns None
@@ -210,7 +231,7 @@ class PubSub:
             >>> sub_id = bus.subscribe("order.created", handle_event)
             >>> sub_id = bus.subscribe("*", handle_event, correlation_id="my-id")
             >>> sub_id
-            '...'  # UUID string
+            'sub-...'
         """
         # Validate inputs
         if not topic or not isinstance(topic, str):
@@ -230,7 +251,7 @@ class PubSub:
                 raise SplurgePubSubRuntimeError("Cannot subscribe: PubSub has been shutdown")
 
             # Generate unique subscriber ID
-            subscriber_id: SubscriberId = str(uuid4())
+            subscriber_id: SubscriberId = f"sub-{next(_subscriber_sequence)}"
 
             # Create entry
             entry = _SubscriberEntry(
@@ -241,15 +262,24 @@ class PubSub:
 
             # Handle wildcard topic "*"
             if topic == "*":
-                self._wildcard_subscribers.append(entry)
+                self._wildcard_subscribers = (*self._wildcard_subscribers, entry)
+                self._route_cache.clear()
                 logger.debug(
                     f"Subscriber {subscriber_id} subscribed to all topics (correlation_id={correlation_id_filter!r})"
                 )
             else:
-                # Add to registry
-                if topic not in self._subscribers:
-                    self._subscribers[topic] = []
-                self._subscribers[topic].append(entry)
+                # Add to registry. New plain-str keys are interned so the registry
+                # probes that remain (publish's zero-subscriber check and
+                # _resolve_route on a route-cache miss) match literal topics on
+                # identity. Dispatch itself reads _route_cache, which is keyed by
+                # published topics. str subclasses (e.g. str-based Enum members)
+                # cannot be interned and are stored as given.
+                existing = self._subscribers.get(topic)
+                if existing is None:
+                    self._subscribers[sys.intern(topic) if type(topic) is str else topic] = (entry,)
+                else:
+                    self._subscribers[topic] = (*existing, entry)
+                self._route_cache.pop(topic, None)
                 logger.debug(
                     f"Subscriber {subscriber_id} subscribed to topic '{topic}'"
                     f" (correlation_id={correlation_id_filter!r})"
@@ -257,52 +287,163 @@ class PubSub:
 
         return subscriber_id
 
-    def _matches_correlation_id(self, message: Message, entry: _SubscriberEntry) -> bool:
-        """Check if message correlation_id matches subscriber filter.
+    def _worker_loop(self) -> None:
+        """Background worker thread loop that processes queued messages.
+
+        Continuously dequeues messages and dispatches them to subscribers.
+        When the queue is empty the worker marks itself idle (waking any
+        drain() callers) and sleeps until a publisher signals new work.
+        Stops when shutdown is signaled.
+        """
+        # Bound to locals once; the loop runs for every message
+        message_queue = self._message_queue
+        popleft = message_queue.popleft
+        dispatch = self._dispatch_message
+        wakeup = self._worker_wakeup
+        stop_event = self._worker_stop_event
+
+        while not stop_event.is_set():
+            if message_queue:
+                # Mark busy before popping so drain() never sees an empty
+                # queue while a message is still in flight
+                self._worker_idle = False
+                message = popleft()
+                try:
+                    dispatch(message)
+                except Exception as e:
+                    # Log worker thread exceptions but don't crash
+                    logger.error(f"Error in worker thread: {e}", exc_info=True)
+                continue
+
+            # Clear before re-checking so a publish racing with us always
+            # either is seen by the re-check or sets the event again
+            wakeup.clear()
+            if message_queue:
+                continue
+
+            with self._idle_condition:
+                self._worker_idle = True
+                self._idle_condition.notify_all()
+
+            wakeup.wait()
+
+        # Release any drain() callers still waiting on a stopped worker
+        with self._idle_condition:
+            self._worker_idle = True
+            self._idle_condition.notify_all()
+
+    def _start_worker(self) -> None:
+        """Start the background worker thread if it is not already running."""
+        with self._lock:
+            if self._worker_thread is not None or self._is_shutdown:
+                return
+            self._worker_thread = threading.Thread(
+                target=self._worker_loop,
+                name="PubSub-Worker",
+                daemon=True,
+            )
+            self._worker_thread.start()
+        logger.debug("PubSub worker thread started")
+
+    def _notify_worker(self) -> None:
+        """Wake the worker thread after enqueueing, starting it on first use."""
+        if self._worker_thread is None:
+            self._start_worker()
+        if not self._worker_wakeup.is_set():
+            self._worker_wakeup.set()
+
+    def _resolve_correlation_id(self, correlation_id: str | None, method: str) -> str:
+        """Resolve the correlation_id a published message will carry.
+
+        IDs already in correlation_ids were validated when first recorded, so
+        they are returned as-is. The type check keeps unhashable values off the
+        set lookup so they are rejected by validation like any other invalid
+        value.
 
         Args:
-            message: Published message
-            entry: Subscriber entry to check
+            correlation_id: correlation_id argument passed to the publish method
+            method: Name of the publish method, used in error messages
 
         Returns:
-            True if correlation_id matches filter, False otherwise
+            The correlation ID to attach to the message
+
+        Raises:
+            SplurgePubSubValueError: If correlation_id is '*' or otherwise invalid
         """
-        # If filter is None, it's a wildcard - match any correlation_id
-        if entry.correlation_id_filter is None:
-            return True
-        # Otherwise, exact match required
-        return entry.correlation_id_filter == message.correlation_id
+        if type(correlation_id) is str and correlation_id in self._correlation_ids:
+            return correlation_id
+        resolved = self._normalize_correlation_id(correlation_id, self._correlation_id, allow_wildcard=False)
+        if resolved is None:
+            raise SplurgePubSubValueError(f"correlation_id cannot be None after normalization in {method}()")
+        return resolved
 
-    def _worker_loop(self) -> None:
-        """Background worker thread loop that processes queued messages.
+    def _record_correlation_id(self, correlation_id: str) -> None:
+        """Add a correlation ID to correlation_ids; only a new ID takes the lock.
 
-        Continuously dequeues messages and dispatches them to subscribers.
-        Stops when shutdown is signaled.
+        Args:
+            correlation_id: Validated correlation ID of an enqueued message
         """
-        while not self._worker_stop_event.is_set():
-            message = None
-            try:
-                # Get message from queue with timeout for responsive shutdown
-                try:
-                    message = self._message_queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
+        if correlation_id not in self._correlation_ids:
+            with self._lock:
+                self._correlation_ids.add(correlation_id)
 
-                # Process the message
-                self._dispatch_message(message)
+    def _has_no_listeners(self, topic: Topic) -> bool:
+        """Check whether a message for ``topic`` can be dropped instead of queued.
 
-            except Exception as e:
-                # Log worker thread exceptions but don't crash
-                logger.error(f"Error in worker thread: {e}", exc_info=True)
-            finally:
-                # Always mark task as done, even if exception occurred
-                # This ensures drain() doesn't hang
-                if message is not None:
-                    try:
-                        self._message_queue.task_done()
-                    except ValueError:
-                        # task_done() called more times than get() - shouldn't happen but be safe
-                        pass
+        True only while the worker is idle with an empty queue, so no earlier
+        message is pending whose callbacks could still subscribe to the topic,
+        and the topic has no topic or wildcard subscribers.
+
+        The order of the reads matters. The queue is read before the idle flag
+        because the worker clears the flag before popping. Subscribers are read
+        last, so they reflect every callback that has already finished.
+
+        Args:
+            topic: Topic of the message about to be enqueued
+
+        Returns:
+            True if nothing could receive the message
+        """
+        return (
+            not self._message_queue
+            and self._worker_idle
+            and topic not in self._subscribers
+            and not self._wildcard_subscribers
+        )
+
+    def _resolve_route(self, topic: Topic, correlation_id: str | None) -> tuple[Callback, ...]:
+        """Build and cache the callbacks that receive a topic/correlation_id pair.
+
+        The route keeps subscription order: topic subscribers first, then
+        wildcard ("*") subscribers, skipping any whose correlation_id filter
+        does not accept ``correlation_id`` (a None filter accepts all).
+
+        Args:
+            topic: Topic of the message being dispatched
+            correlation_id: Correlation ID of the message being dispatched
+
+        Returns:
+            Tuple of callbacks to invoke, in order
+        """
+        with self._lock:
+            route = tuple(
+                entry.callback
+                for entry in self._subscribers.get(topic, ()) + self._wildcard_subscribers
+                if entry.correlation_id_filter is None or entry.correlation_id_filter == correlation_id
+            )
+
+            route_cache = self._route_cache
+            routes = route_cache.get(topic)
+            if routes is None:
+                if len(route_cache) >= _ROUTE_CACHE_MAX_SIZE:
+                    # Evict the oldest topic (dicts keep insertion order)
+                    del route_cache[next(iter(route_cache))]
+                routes = route_cache[topic] = {}
+            elif len(routes) >= _ROUTE_CACHE_MAX_CORRELATION_IDS:
+                # Per-message correlation_ids would otherwise grow this without bound
+                routes.clear()
+            routes[correlation_id] = route
+            return route
 
     def _dispatch_message(self, message: Message) -> None:
         """Dispatch a message to all matching subscribers.
@@ -311,33 +452,29 @@ class PubSub:
             message: The message to dispatch
         """
         topic = message.topic
+        correlation_id = message.correlation_id
 
-        # Get snapshot of subscribers (release lock before callbacks)
-        with self._lock:
-            # Skip dispatch if shutdown
-            if self._is_shutdown:
-                return
-            topic_subscribers = list(self._subscribers.get(topic, []))
-            wildcard_subscribers = list(self._wildcard_subscribers)
-
-        # Execute callbacks outside lock to allow re-entrant publishes
-        # Check topic-based subscribers
-        for entry in topic_subscribers:
-            if self._matches_correlation_id(message, entry):
-                try:
-                    entry.callback(message)
-                except Exception as e:
-                    # Call error handler for subscriber exceptions
-                    self._error_handler(e, topic)
-
-        # Check wildcard subscribers (topic="*")
-        for entry in wildcard_subscribers:
-            if self._matches_correlation_id(message, entry):
-                try:
-                    entry.callback(message)
-                except Exception as e:
-                    # Call error handler for subscriber exceptions
-                    self._error_handler(e, topic)
+        # Skip dispatch if shutdown
+        if self._is_shutdown:
+            return
+
+        # Routes are immutable tuples, so a cached route is already a snapshot and
+        # is read without the lock. Writers (subscribe/unsubscribe/clear) only
+        # replace or drop cache entries under the lock.
+        routes = self._route_cache.get(topic)
+        route = routes.get(correlation_id) if routes is not None else None
+        if route is None:
+            route = self._resolve_route(topic, correlation_id)
+
+        # Execute callbacks outside lock to allow re-entrant publishes.
+        # The route is already filtered by correlation_id.
+        error_handler = self._error_handler
+        for callback in route:
+            try:
+                callback(message)
+            except Exception as e:
+                # Call error handler for subscriber exceptions
+                error_handler(e, topic)
 
     def publish(
         self,
@@ -355,6 +492,8 @@ class PubSub:
 
         All subscribers for the topic receive the message via their callbacks.
         Callbacks are invoked asynchronously in the order subscriptions were made.
+        The message is built once and every callback receives the same instance.
+        The data dict is stored as given, not copied, so it must not be mutated after publishing.
 
         If a callback raises an exception, it is passed to the error handler.
         Exceptions in one callback do not affect other callbacks or the publisher.
@@ -392,26 +531,129 @@ class PubSub:
             raise SplurgePubSubValueError(f"Topic must be a non-empty string, got: {topic!r}")
 
         # Normalize correlation_id (raises error if '*' in publish)
-        message_correlation_id = self._normalize_correlation_id(
-            correlation_id, self._correlation_id, allow_wildcard=False
-        )
-        if message_correlation_id is None:
-            raise SplurgePubSubValueError("correlation_id cannot be None after normalization in publish()")
-
-        # Add to correlation_ids set (thread-safe)
-        with self._lock:
-            self._correlation_ids.add(message_correlation_id)
-
-        # Initialize data and metadata to empty dicts if None
-        message = Message(
-            topic=topic,
-            data=data if data is not None else {},
-            metadata=metadata if metadata is not None else {},
-            correlation_id=message_correlation_id,
+        message_correlation_id = self._resolve_correlation_id(correlation_id, "publish")
+        self._record_correlation_id(message_correlation_id)
+
+        # Fast path for topics nobody listens to. The arguments are validated
+        # exactly as Message would, but no message is built or queued and the
+        # worker is not woken.
+        if self._has_no_listeners(topic):
+            _validate_fields(topic, data if data is not None else {}, None)
+            return
+
+        # Initialize data and metadata to empty dicts if None; the correlation_id
+        # was validated above, so only topic and data are checked again
+        message = _build_message(
+            topic,
+            data if data is not None else {},
+            message_correlation_id,
+            metadata if metadata is not None else {},
         )
 
         # Enqueue message for async dispatch
-        self._message_queue.put(message)
+        self._message_queue.append(message)
+        self._notify_worker()
+
+    def _enqueue(self, message: Message) -> None:
+        """Enqueue an already-validated message for dispatch.
+
+        Used by PubSubAggregator to forward messages from managed buses without
+        re-validating or re-allocating them. The message (including its timestamp)
+        is delivered to subscribers as-is.
+
+        Args:
+            message: Message previously constructed by another PubSub instance
+
+        Raises:
+            SplurgePubSubRuntimeError: If the bus is shutdown
+        """
+        if self._is_shutdown:
+            raise SplurgePubSubRuntimeError("Cannot publish: PubSub has been shutdown")
+
+        if message.correlation_id is not None:
+            self._record_correlation_id(message.correlation_id)
+
+        # Same fast path as publish(): drop messages for topics this bus has
+        # no subscribers for, as long as nothing pending could subscribe first
+        if self._has_no_listeners(message.topic):
+            return
+
+        self._message_queue.append(message)
+        self._notify_worker()
+
+    def publish_many(
+        self,
+        messages: "Iterable[tuple[Topic, MessageData | None]]",
+        metadata: Metadata | None = None,
+        *,
+        correlation_id: str | None = None,
+    ) -> None:
+        """Publish a batch of messages in a single call.
+
+        Equivalent to calling publish() once per (topic, data) pair, but the
+        shutdown check and correlation_id normalization run once for the whole
+        batch. Every message is built and validated before any is enqueued, so
+        an invalid entry leaves nothing published.
+
+        Messages are dispatched in the order given.
+
+        Args:
+            messages: Iterable of (topic, data) pairs. data may be None for an empty payload.
+            metadata: Optional metadata dictionary applied to every message in the batch.
+                      Defaults to empty dict if None.
+            correlation_id: Optional correlation ID override applied to every message in the batch.
+                           Same rules as publish(). Must be passed as a keyword argument.
+
+        Raises:
+            SplurgePubSubValueError: If any topic is empty or not a string, or correlation_id is invalid
+            SplurgePubSubTypeError: If any entry is not a (topic, data) pair, or any data is
+                not a dict[str, Any] or has non-string keys
+            SplurgePubSubRuntimeError: If the bus is shutdown
+
+        Example:
+            >>> bus = PubSub()
+            >>> bus.publish_many(
+            ...     [
+            ...         ("db.connection.opened", {"pool_size": 10}),
+            ...         ("db.query.executed", {"duration_ms": 45}),
+            ...     ]
+            ... )
+            >>> bus.drain()
+        """
+        # Check shutdown state
+        if self._is_shutdown:
+            raise SplurgePubSubRuntimeError("Cannot publish: PubSub has been shutdown")
+
+        # Normalize correlation_id once for the whole batch
+        message_correlation_id = self._resolve_correlation_id(correlation_id, "publish_many")
+
+        # Build (and validate) every message before enqueueing any of them
+        batch: list[Message] = []
+        for item in messages:
+            try:
+                topic, data = item
+            except (TypeError, ValueError):
+                raise SplurgePubSubTypeError(
+                    f"publish_many() entries must be (topic, data) pairs, got: {item!r}"
+                ) from None
+            if not topic or not isinstance(topic, str):
+                raise SplurgePubSubValueError(f"Topic must be a non-empty string, got: {topic!r}")
+            batch.append(
+                _build_message(
+                    topic,
+                    data if data is not None else {},
+                    message_correlation_id,
+                    metadata if metadata is not None else {},
+                )
+            )
+
+        if not batch:
+            return
+
+        self._record_correlation_id(message_correlation_id)
+
+        self._message_queue.extend(batch)
+        self._notify_worker()
 
     def unsubscribe(
         self,
@@ -444,7 +686,9 @@ class PubSub:
             if topic == "*":
                 for i, entry in enumerate(self._wildcard_subscribers):
                     if entry.subscriber_id == subscriber_id:
-                        self._wildcard_subscribers.pop(i)
+                        wildcard = self._wildcard_subscribers
+                        self._wildcard_subscribers = wildcard[:i] + wildcard[i + 1 :]
+                        self._route_cache.clear()
                         logger.debug(f"Subscriber {subscriber_id} unsubscribed from all topics")
                         return
                 raise SplurgePubSubLookupError(f"Subscriber '{subscriber_id}' not found for wildcard topic '*'")
@@ -456,11 +700,14 @@ class PubSub:
             subscribers = self._subscribers[topic]
             for i, entry in enumerate(subscribers):
                 if entry.subscriber_id == subscriber_id:
-                    subscribers.pop(i)
+                    remaining = subscribers[:i] + subscribers[i + 1 :]
                     logger.debug(f"Subscriber {subscriber_id} unsubscribed from topic '{topic}'")
-                    # Clean up empty topic lists
-                    if not subscribers:
+                    # Clean up empty topic entries
+                    if remaining:
+                        self._subscribers[topic] = remaining
+                    else:
                         del self._subscribers[topic]
+                    self._route_cache.pop(topic, None)
                     return
 
             raise SplurgePubSubLookupError(f"Subscriber '{subscriber_id}' not found for topic '{topic}'")
@@ -487,16 +734,19 @@ class PubSub:
             if topic is None:
                 # Clear all subscribers
                 self._subscribers.clear()
-                self._wildcard_subscribers.clear()
+                self._wildcard_subscribers = ()
+                self._route_cache.clear()
                 logger.debug("All subscribers cleared")
             elif topic == "*":
                 # Clear only wildcard subscribers
-                self._wildcard_subscribers.clear()
+                self._wildcard_subscribers = ()
+                self._route_cache.clear()
                 logger.debug("Wildcard subscribers cleared")
             else:
                 # Clear specific topic
                 if topic in self._subscribers:
                     del self._subscribers[topic]
+                    self._route_cache.pop(topic, None)
                     logger.debug(f"Subscribers cleared for topic '{topic}'")
 
     def drain(self, timeout: int = 2000) -> bool:
@@ -522,29 +772,14 @@ class PubSub:
         if self._is_shutdown:
             return True  # Already shutdown, queue should be empty
 
-        # Convert milliseconds to seconds
-        timeout_seconds = timeout / 1000.0
-        start_time = time.time()
-
-        # Poll until queue is empty and all tasks are done
-        # Check both empty() and unfinished_tasks to handle race conditions
-        while True:
-            # Check if queue is empty AND all tasks are done
-            if self._message_queue.empty() and self._message_queue.unfinished_tasks == 0:
-                return True
-
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed >= timeout_seconds:
-                return False
-
-            # Small sleep to avoid busy-waiting, but check frequently
-            sleep_time = min(0.01, timeout_seconds - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            else:
-                # Timeout expired, return False
-                return False
+        # Woken by the worker each time it goes idle; no polling. The queue is
+        # read before the idle flag: the worker clears the flag before popping,
+        # so an empty queue followed by an idle worker means nothing is in flight
+        with self._idle_condition:
+            return self._idle_condition.wait_for(
+                lambda: self._is_shutdown or (not self._message_queue and self._worker_idle),
+                timeout=timeout / 1000.0,
+            )
 
     def shutdown(self) -> None:
         """Shutdown the bus and prevent further operations.
@@ -568,8 +803,9 @@ class PubSub:
 
             self._is_shutdown = True
 
-        # Signal worker thread to stop
+        # Signal worker thread to stop (and wake it if it is waiting for work)
         self._worker_stop_event.set()
+        self._worker_wakeup.set()
 
         # Wait for worker thread to finish
         if self._worker_thread is not None and self._worker_thread.is_alive():
@@ -580,7 +816,8 @@ class PubSub:
         # Clear subscribers
         with self._lock:
             self._subscribers.clear()
-            self._wildcard_subscribers.clear()
+            self._wildcard_subscribers = ()
+            self._route_cache.clear()
 
         logger.debug("PubSub shutdown complete")
 
@@ -656,6 +893,11 @@ class PubSub:
     def correlation_ids(self) -> set[str]:
         """Get all correlation IDs that have been published.
 
+        The set is maintained incrementally: publish(), publish_many() and
+        messages forwarded by a PubSubAggregator add new IDs as they are
+        enqueued. Reading the property copies that set; it never scans
+        subscribers or messages.
+
         Returns:
             A copy of the set of all correlation IDs that have been published.
             Includes the instance correlation_id and any correlation_ids used in publish().
@@ -702,7 +944,8 @@ class PubSub:
             >>> "topic" in bus.subscribers
             True
         """
-        return self._subscribers.copy()
+        subscribers = self._subscribers.copy()
+        return {topic: list(entries) for topic, entries in subscribers.items()}
 
     @property
     def wildcard_subscribers(self) -> list[_SubscriberEntry]:
@@ -719,4 +962,4 @@ class PubSub:
             >>> len(bus.wildcard_subscribers)
             1
         """
-        return self._wildcard_subscribers.copy()
+        return list(self._wildcard_subscribers)
@@ -11,16 +11,16 @@ Domains:
 
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING
 
 from .errors import ErrorHandler
 from .exceptions import SplurgePubSubLookupError, SplurgePubSubRuntimeError, SplurgePubSubValueError
-from .message import Message
 from .pubsub import PubSub
-from .types import Callback, MessageData, Metadata, SubscriberId
+from .types import Callback, MessageData, Metadata, SubscriberId, Topic
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
 DOMAINS = ["pubsub", "pubsub-aggregator"]
 
@@ -104,23 +104,6 @@ class PubSubAggregator:
             for pubsub in pubsubs:
                 self.add_pubsub(pubsub)
 
-    def _forward_message(self, message: Message) -> None:
-        """Forward a message from a managed PubSub to internal bus.
-
-        This callback is registered with managed PubSub instances to receive
-        all messages and republish them to the internal bus.
-
-        Args:
-            message: Message received from a managed PubSub instance
-        """
-        # Republish to internal bus (non-blocking)
-        self._internal_bus.publish(
-            message.topic,
-            message.data,
-            metadata=message.metadata,
-            correlation_id=message.correlation_id,
-        )
-
     def add_pubsub(self, pubsub: PubSub) -> None:
         """Add a PubSub instance to the aggregator.
 
@@ -154,8 +137,11 @@ class PubSubAggregator:
                 raise SplurgePubSubRuntimeError("PubSub instance is already managed by this PubSubAggregator")
 
             # Subscribe to all topics on the managed PubSub
-            # Use correlation_id="*" to match all correlation_ids
-            subscriber_id = pubsub.subscribe("*", self._forward_message, correlation_id="*")
+            # Use correlation_id="*" to match all correlation_ids.
+            # The managed bus already validated each message, so its dispatch
+            # hands the same immutable instance straight to the internal bus's
+            # queue: no copy, no re-validation and no intermediate frame.
+            subscriber_id = pubsub.subscribe("*", self._internal_bus._enqueue, correlation_id="*")
             self._managed_pubsubs[pubsub] = subscriber_id
 
             logger.debug(f"Added PubSub instance to PubSubAggregator (subscriber_id={subscriber_id})")
@@ -287,12 +273,44 @@ class PubSubAggregator:
             >>> aggregator.publish("topic", {"data": "test"})
             >>> aggregator.drain()
         """
-        with self._lock:
-            if self._is_shutdown:
-                raise SplurgePubSubRuntimeError("Cannot publish: PubSubAggregator has been shutdown")
+        # Plain read of the flag: taking the lock here would serialize publishers
+        # without making the check any less racy with a concurrent shutdown()
+        if self._is_shutdown:
+            raise SplurgePubSubRuntimeError("Cannot publish: PubSubAggregator has been shutdown")
 
         self._internal_bus.publish(topic, data, metadata=metadata, correlation_id=correlation_id)
 
+    def publish_many(
+        self,
+        messages: "Iterable[tuple[Topic, MessageData | None]]",
+        metadata: Metadata | None = None,
+        *,
+        correlation_id: str | None = None,
+    ) -> None:
+        """Publish a batch of messages to the aggregator bus.
+
+        Like publish(), this publishes to the internal bus only and does NOT
+        publish to managed PubSub instances.
+
+        Args:
+            messages: Iterable of (topic, data) pairs. data may be None for an empty payload.
+            metadata: Optional metadata dictionary applied to every message in the batch.
+            correlation_id: Optional correlation ID override applied to every message in the batch.
+                           Must be passed as a keyword argument.
+
+        Raises:
+            SplurgePubSubRuntimeError: If PubSubAggregator is shutdown
+
+        Example:
+            >>> aggregator = PubSubAggregator()
+            >>> aggregator.publish_many([("topic.a", {"n": 1}), ("topic.b", {"n": 2})])
+            >>> aggregator.drain()
+        """
+        if self._is_shutdown:
+            raise SplurgePubSubRuntimeError("Cannot publish: PubSubAggregator has been shutdown")
+
+        self._internal_bus.publish_many(messages, metadata=metadata, correlation_id=correlation_id)
+
     def clear(
         self,
         topic: str | None = None,
@@ -317,8 +335,14 @@ class PubSubAggregator:
         Blocks until all queued messages have been processed, or until the
         timeout expires. Optionally cascades drain to managed PubSub instances.
 
+        With cascade=True the managed PubSub instances are drained first, so
+        every message they forward is already on the internal bus when the
+        internal bus is drained. A single drain(cascade=True) therefore replaces
+        draining each managed bus and then the aggregator.
+
         Args:
             timeout: Maximum time to wait in milliseconds. Defaults to 2000ms.
+                    With cascade=True the timeout covers the whole cascade.
             cascade: If True, also calls drain() on all managed PubSub instances.
                     Defaults to False. Must be passed as a keyword argument.
 
@@ -331,26 +355,34 @@ class PubSubAggregator:
             >>> aggregator.publish("topic", {"data": "test"})
             >>> aggregator.drain()  # Wait for internal bus only
             True
-            >>> aggregator.drain(cascade=True)  # Wait for internal and managed buses
+            >>> bus_b.publish("topic", {"data": "test"})
+            >>> aggregator.drain(cascade=True)  # Wait for managed buses, then internal bus
             True
         """
         if self._is_shutdown:
             return True  # Already shutdown, queue should be empty
 
-        # Drain internal bus first
-        result = self._internal_bus.drain(timeout)
+        if not cascade:
+            return self._internal_bus.drain(timeout)
 
-        # Optionally cascade to managed PubSub instances
-        if cascade:
-            with self._lock:
-                managed_pubsubs = list(self._managed_pubsubs.keys())
-
-            # Drain each managed PubSub (use same timeout for all)
-            for pubsub in managed_pubsubs:
-                if not pubsub.is_shutdown:
-                    managed_result = pubsub.drain(timeout)
-                    if not managed_result:
-                        result = False  # At least one failed
+        with self._lock:
+            managed_pubsubs = list(self._managed_pubsubs.keys())
+
+        # Share one deadline across the cascade
+        deadline = time.monotonic() + timeout / 1000.0
+        result = True
+
+        # Drain managed PubSub instances first so their forwarded messages
+        # are queued on the internal bus before it is drained
+        for pubsub in managed_pubsubs:
+            if not pubsub.is_shutdown:
+                remaining = max(0, int((deadline - time.monotonic()) * 1000))
+                if not pubsub.drain(remaining):
+                    result = False  # At least one failed
+
+        remaining = max(0, int((deadline - time.monotonic()) * 1000))
+        if not self._internal_bus.drain(remaining):
+            result = False
 
         return result
 
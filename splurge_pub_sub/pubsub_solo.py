@@ -20,6 +20,8 @@ from .pubsub import PubSub
 from .types import Callback, MessageData, Metadata, SubscriberId, Topic
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .decorators import TopicDecorator
 
 DOMAINS = ["pubsub", "pubsub-solo"]
@@ -127,16 +129,22 @@ class PubSubSolo:
             >>> bus_a2 = PubSubSolo.get_instance(scope="package_a")
             >>> bus_a is bus_a2  # True
         """
-        if scope not in cls._instances:
-            scope_lock = cls._get_lock(scope)
-            with scope_lock:
-                # Double-check locking pattern
-                if scope not in cls._instances:
-                    cls._instances[scope] = PubSub(
-                        error_handler=error_handler,
-                        correlation_id=correlation_id,
-                    )
-        return cls._instances[scope]
+        # Fast path: a single lock-free dict read (atomic under the GIL)
+        instance = cls._instances.get(scope)
+        if instance is not None:
+            return instance
+
+        scope_lock = cls._get_lock(scope)
+        with scope_lock:
+            # Double-check locking pattern
+            instance = cls._instances.get(scope)
+            if instance is None:
+                instance = PubSub(
+                    error_handler=error_handler,
+                    correlation_id=correlation_id,
+                )
+                cls._instances[scope] = instance
+            return instance
 
     @classmethod
     def is_initialized(cls, scope: str) -> bool:
@@ -217,6 +225,25 @@ class PubSubSolo:
         """
         cls.get_instance(scope=scope).publish(topic, data, metadata, correlation_id=correlation_id)
 
+    @classmethod
+    def publish_many(
+        cls,
+        messages: "Iterable[tuple[Topic, MessageData | None]]",
+        metadata: Metadata | None = None,
+        *,
+        scope: str,
+        correlation_id: str | None = None,
+    ) -> None:
+        """Publish a batch of messages (delegates to singleton instance for scope).
+
+        Args:
+            messages: Iterable of (topic, data) pairs
+            metadata: Optional metadata dictionary applied to every message
+            scope: Scope name for the singleton instance. Must be passed as a keyword argument.
+            correlation_id: Optional correlation ID override. Must be passed as a keyword argument.
+        """
+        cls.get_instance(scope=scope).publish_many(messages, metadata, correlation_id=correlation_id)
+
     @classmethod
     def unsubscribe(
         cls,
@@ -295,9 +322,32 @@ class PubSubSolo:
         """
         scope_lock = cls._get_lock(scope)
         with scope_lock:
-            if scope in cls._instances:
-                cls._instances[scope].shutdown()
-                del cls._instances[scope]
+            # pop() rather than check-then-delete: shutdown_all() may clear
+            # the registry concurrently without taking this scope's lock
+            instance = cls._instances.pop(scope, None)
+            if instance is not None:
+                instance.shutdown()
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Shutdown the singleton instances for every scope.
+
+        Detaches all instances from the registry under a single lock
+        acquisition, then shuts each one down outside the lock.
+
+        Example:
+            >>> PubSubSolo.get_instance(scope="package_a")
+            >>> PubSubSolo.get_instance(scope="package_b")
+            >>> PubSubSolo.shutdown_all()
+            >>> PubSubSolo.get_all_scopes()
+            []
+        """
+        with cls._instance_lock:
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+
+        for instance in instances:
+            instance.shutdown()
 
     @classmethod
     def on(
@@ -31,7 +31,8 @@ SubscriberId = str
 Unique identifier for a subscriber.
 
 Used to reference subscriptions for unsubscription and management.
-Currently implemented as string UUID, but could be extended to other types.
+Currently a string of the form "sub-<n>", where n is a process-wide
+sequence number, but could be extended to other types.
 
 Example:
     subscriber_id: SubscriberId = bus.subscribe("topic", callback)
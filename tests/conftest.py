@@ -1,12 +1,14 @@
 """Pytest configuration and shared fixtures for Splurge Pub-Sub tests."""
 
 import logging
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import pytest
 
-from splurge_pub_sub import Message, PubSub
+from splurge_pub_sub import Message, PubSub, PubSubAggregator
 
 # Configure logging for tests
 logging.basicConfig(level=logging.DEBUG)
@@ -76,9 +78,19 @@ def sample_callbacks() -> dict[str, Callable[[Message], None]]:
 
 
 @pytest.fixture
-def pubsub() -> PubSub:
-    """Fresh PubSub instance for each test."""
-    return PubSub()
+def pubsub() -> Iterator[PubSub]:
+    """Fresh PubSub instance for each test, shut down afterwards."""
+    bus = PubSub()
+    yield bus
+    bus.shutdown()
+
+
+@pytest.fixture
+def composite() -> Iterator[PubSubAggregator]:
+    """Fresh PubSubAggregator for each test, shut down with its managed buses afterwards."""
+    aggregator = PubSubAggregator()
+    yield aggregator
+    aggregator.shutdown(cascade=True)
 
 
 @pytest.fixture
@@ -110,6 +122,42 @@ def pubsub_with_subscribers(
     return pubsub, subscriber_ids
 
 
+# ============================================================================
+# Fixtures: Concurrency
+# ============================================================================
+
+
+@pytest.fixture
+def lock_holder() -> Callable[[AbstractContextManager[Any]], AbstractContextManager[None]]:
+    """Hold a lock from another thread for the duration of a with block.
+
+    Returns:
+        Context manager factory: ``with lock_holder(bus._lock): ...`` runs the
+        block while a background thread owns the lock.
+    """
+
+    @contextmanager
+    def hold(lock: AbstractContextManager[Any]) -> Iterator[None]:
+        lock_held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock() -> None:
+            with lock:
+                lock_held.set()
+                release.wait(timeout=5.0)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        try:
+            assert lock_held.wait(timeout=5.0)
+            yield
+        finally:
+            release.set()
+            holder.join()
+
+    return hold
+
+
 # ============================================================================
 # Fixtures: Logging Capture
 # ============================================================================
@@ -14,6 +14,7 @@ from splurge_pub_sub import (
     PubSubAggregator,
     PubSubSolo,
     SplurgePubSubRuntimeError,
+    TopicPattern,
 )
 
 
@@ -40,7 +41,7 @@ class TestIntegrationScenarios:
             )
 
         def analytics_subscriber(msg: Message) -> None:
-            analytics_recorded.append({"event_type": msg.topic, "timestamp": msg.timestamp})
+            analytics_recorded.append({"event_type": msg.topic, "timestamp_ns": msg.timestamp_ns})
 
         # Subscribe all handlers
         bus.subscribe("user.created", logging_subscriber)
@@ -60,6 +61,7 @@ class TestIntegrationScenarios:
         assert logged_events[0]["data"]["name"] == "Alice"
         assert notifications_sent[0]["email"] == "alice@example.com"
         assert analytics_recorded[0]["event_type"] == "user.created"
+        assert isinstance(analytics_recorded[0]["timestamp_ns"], int)
 
     def test_scenario_cascading_events_subscribers_publish(self) -> None:
         """Test cascading events where subscribers publish new events."""
@@ -143,6 +145,50 @@ class TestIntegrationScenarios:
         # All should have received
         assert len(received) == 500
 
+    def test_scenario_many_distinct_topics(self) -> None:
+        """Test that publishing routes only to the exact topic among many."""
+        bus = PubSub()
+        received: list[str] = []
+
+        def make_subscriber(topic: str) -> Any:
+            def sub(msg: Message) -> None:
+                received.append(topic)
+
+            return sub
+
+        # 500 distinct hierarchical topics, one subscriber each
+        for i in range(500):
+            topic = f"service.{i % 10}.event_{i}"
+            bus.subscribe(topic, make_subscriber(topic))
+
+        bus.publish("service.7.event_257", {"data": "test"})
+        bus.publish("service.7", {"data": "no subscribers"})
+        bus.drain()
+
+        assert received == ["service.7.event_257"]
+
+    def test_scenario_pattern_subscription_via_wildcard(self) -> None:
+        """Test that segment patterns are literal topics and are matched via "*" plus TopicPattern."""
+        bus = PubSub()
+        literal: list[str] = []
+        matched: list[str] = []
+        user_events = TopicPattern("user.*")
+
+        bus.subscribe("user.*", lambda msg: literal.append(msg.topic))
+
+        def on_any(msg: Message) -> None:
+            if user_events.matches(msg.topic):
+                matched.append(msg.topic)
+
+        bus.subscribe("*", on_any)
+
+        for topic in ["user.created", "order.created", "user.deleted", "user.*"]:
+            bus.publish(topic, {})
+        bus.drain()
+
+        assert literal == ["user.*"]
+        assert matched == ["user.created", "user.deleted", "user.*"]
+
     def test_scenario_resource_cleanup_on_shutdown(self) -> None:
         """Test that shutdown properly cleans up resources."""
         bus = PubSub()
@@ -160,6 +160,18 @@ class TestCLIMainFunction:
         assert isinstance(result, int)
         assert result == 0
 
+    def test_main_reuses_module_parser(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that main does not rebuild the argument parser on each call."""
+        from splurge_pub_sub import cli
+
+        def fail() -> None:
+            raise AssertionError("parser rebuilt")
+
+        monkeypatch.setattr(cli, "_build_parser", fail)
+
+        assert main([]) == 0
+        assert main([]) == 0
+
 
 class TestCLIIntegration:
     """Integration tests for CLI."""
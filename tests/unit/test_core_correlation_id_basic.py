@@ -13,7 +13,7 @@ Test Cases:
 import pytest
 
 from splurge_pub_sub import Message, PubSub, SplurgePubSubValueError
-from splurge_pub_sub.utility import is_valid_correlation_id, validate_correlation_id
+from splurge_pub_sub.utility import generate_correlation_id, is_valid_correlation_id, validate_correlation_id
 
 
 class TestCorrelationIdConstructor:
@@ -160,6 +160,66 @@ class TestCorrelationIdPublish:
         with pytest.raises(SplurgePubSubValueError, match="\\*"):
             bus.publish("test.topic", {}, correlation_id="*")
 
+    def test_publish_validates_each_correlation_id_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a correlation_id already recorded by the bus is not re-validated by publish."""
+        from splurge_pub_sub import pubsub as pubsub_module
+
+        validated: list[str] = []
+
+        def counting_validate(correlation_id: str) -> None:
+            validated.append(correlation_id)
+            validate_correlation_id(correlation_id)
+
+        monkeypatch.setattr(pubsub_module, "validate_correlation_id", counting_validate)
+        bus = PubSub(correlation_id="instance-id")
+
+        for _ in range(3):
+            bus.publish("test.topic", {}, correlation_id="custom-id")
+            bus.publish_many([("test.topic", {})], correlation_id="custom-id")
+            bus.publish("test.topic", {}, correlation_id="instance-id")
+        assert validated == ["instance-id", "custom-id"]
+
+        # Invalid IDs are never recorded, so they are rejected every time
+        for _ in range(2):
+            with pytest.raises(SplurgePubSubValueError, match="consecutive"):
+                bus.publish("test.topic", {}, correlation_id="bad..id")
+
+    @pytest.mark.parametrize("correlation_id", [["x"], {}, {"ab": 1}])
+    def test_publish_rejects_unhashable_correlation_id(self, correlation_id: object) -> None:
+        """Test that unhashable correlation_ids raise SplurgePubSubValueError, not TypeError."""
+        bus = PubSub()
+        with pytest.raises(SplurgePubSubValueError):
+            bus.publish("test.topic", {}, correlation_id=correlation_id)  # type: ignore[arg-type]
+        with pytest.raises(SplurgePubSubValueError):
+            bus.publish_many([("test.topic", {})], correlation_id=correlation_id)  # type: ignore[arg-type]
+
+    def test_publish_builds_messages_without_revalidating_correlation_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that messages built by publish do not validate the already-resolved correlation_id again."""
+        from splurge_pub_sub import message as message_module
+
+        validated: list[str] = []
+
+        def counting_validate(correlation_id: str) -> None:
+            validated.append(correlation_id)
+            validate_correlation_id(correlation_id)
+
+        monkeypatch.setattr(message_module, "validate_correlation_id", counting_validate)
+        bus = PubSub(correlation_id="instance-id")
+        received: list[Message] = []
+        bus.subscribe("test.topic", received.append, correlation_id="*")
+
+        bus.publish("test.topic", {})
+        bus.publish("test.topic", {}, correlation_id="custom-id")
+        bus.publish_many([("test.topic", {}), ("test.topic", {})])
+        bus.drain()
+
+        assert validated == []
+        assert [msg.correlation_id for msg in received] == ["instance-id", "custom-id", "instance-id", "instance-id"]
+
+        # Topic and data are still validated
+        with pytest.raises(SplurgePubSubValueError):
+            bus.publish("bad..topic", {})
+
 
 class TestCorrelationIdSubscribe:
     """Tests for correlation_id filtering in subscribe()."""
@@ -383,6 +443,29 @@ class TestCorrelationIdMatching:
         assert received[0].correlation_id == "id-a"
         assert received[0].topic == "topic.a"
 
+    def test_mixed_wildcard_and_exact_filters_preserve_order(self) -> None:
+        """Test wildcard and exact filters on one topic deliver in subscription order."""
+        bus = PubSub()
+        calls: list[tuple[str, str | None]] = []
+
+        bus.subscribe("test.topic", lambda m: calls.append(("any-1", m.correlation_id)), correlation_id="*")
+        bus.subscribe("test.topic", lambda m: calls.append(("exact", m.correlation_id)), correlation_id="id-a")
+        bus.subscribe("test.topic", lambda m: calls.append(("any-2", m.correlation_id)), correlation_id="*")
+        bus.subscribe("*", lambda m: calls.append(("all", m.correlation_id)), correlation_id="id-b")
+
+        bus.publish("test.topic", {}, correlation_id="id-a")
+        bus.publish("test.topic", {}, correlation_id="id-b")
+        bus.drain()
+
+        assert calls == [
+            ("any-1", "id-a"),
+            ("exact", "id-a"),
+            ("any-2", "id-a"),
+            ("any-1", "id-b"),
+            ("any-2", "id-b"),
+            ("all", "id-b"),
+        ]
+
 
 class TestCorrelationIdValidation:
     """Tests for correlation_id validation utility."""
@@ -440,3 +523,26 @@ class TestCorrelationIdValidation:
             with pytest.raises(SplurgePubSubValueError, match="pattern|consecutive"):
                 validate_correlation_id(cid)
             assert is_valid_correlation_id(cid) is False
+
+    def test_generate_correlation_id_is_unique_hex(self) -> None:
+        """Test that generated correlation_ids are valid 32-digit hex strings."""
+        ids = {generate_correlation_id() for _ in range(100)}
+
+        assert len(ids) == 100
+        for cid in ids:
+            assert len(cid) == 32
+            assert int(cid, 16) >= 0
+            assert is_valid_correlation_id(cid) is True
+
+    def test_validate_invalid_correlation_id_trailing_newline(self) -> None:
+        """Test that a trailing newline is rejected rather than matched by '$'."""
+        with pytest.raises(SplurgePubSubValueError, match="pattern"):
+            validate_correlation_id("abc\n")
+        assert is_valid_correlation_id("abc\n") is False
+
+    def test_validate_classifies_failures(self) -> None:
+        """Test that edge separators report the pattern and inner runs report consecutive separators."""
+        with pytest.raises(SplurgePubSubValueError, match="must match pattern"):
+            validate_correlation_id("-ab")
+        with pytest.raises(SplurgePubSubValueError, match="consecutive"):
+            validate_correlation_id("a._b")
@@ -254,6 +254,13 @@ class TestTopicPatternEdgeCases:
         assert pattern.matches("123.456") is True
         assert pattern.matches("123.457") is False
 
+    def test_dot_is_literal(self) -> None:
+        """Test that dots in patterns only match literal dots."""
+        pattern = TopicPattern("order.?.paid")
+        assert pattern.matches("order.1.paid") is True
+        assert pattern.matches("orderx1xpaid") is False
+        assert pattern.matches("order.1xpaid") is False
+
     def test_alphanumeric_with_dash(self) -> None:
         """Test topics with dashes."""
         pattern = TopicPattern("user-account.created-event")
@@ -319,6 +326,43 @@ class TestTopicPatternPerformance:
         for i in range(100):
             pattern.matches(f"user.event_{i}")
 
+    def test_match_results_are_cached(self) -> None:
+        """Test that repeated matches reuse cached results, including misses."""
+        pattern = TopicPattern("user.*")
+
+        assert pattern.matches("user.created") is True
+        assert pattern.matches("order.created") is False
+        assert pattern.matches("user.created") is True
+        assert pattern.matches("order.created") is False
+        assert pattern._match_cache == {"user.created": True, "order.created": False}
+
+    def test_exact_match_bypasses_regex_and_cache(self) -> None:
+        """Test that exact patterns compare strings directly."""
+        pattern = TopicPattern("user.created")
+
+        assert pattern.matches("user.created") is True
+        assert pattern.matches("user.updated") is False
+        assert pattern._match_cache == {}
+
+    def test_match_cache_is_bounded(self) -> None:
+        """Test that the match cache does not grow without limit."""
+        from splurge_pub_sub.filters import _MATCH_CACHE_MAX_SIZE
+
+        pattern = TopicPattern("user.*")
+        for i in range(_MATCH_CACHE_MAX_SIZE + 10):
+            assert pattern.matches(f"user.event_{i}") is True
+
+        assert len(pattern._match_cache) <= _MATCH_CACHE_MAX_SIZE
+
+    def test_match_cache_does_not_affect_equality(self) -> None:
+        """Test that patterns with different cache contents still compare equal."""
+        pattern_a = TopicPattern("user.*")
+        pattern_b = TopicPattern("user.*")
+        pattern_a.matches("user.created")
+
+        assert pattern_a == pattern_b
+        assert hash(pattern_a) == hash(pattern_b)
+
 
 class TestTopicPatternIntegration:
     """Integration tests for topic pattern matching."""
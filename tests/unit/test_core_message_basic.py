@@ -52,6 +52,35 @@ class TestMessageCreation:
 
         assert before <= msg.timestamp <= after
 
+    def test_message_timestamp_iso_matches_isoformat(self) -> None:
+        """Test that timestamp_iso() matches timestamp.isoformat()."""
+        msg = Message(topic="test", data={"value": "test"})
+        assert msg.timestamp_iso() == msg.timestamp.isoformat()
+
+        explicit = datetime(2025, 11, 4, 10, 0, 0, tzinfo=timezone.utc)
+        msg_explicit = Message(topic="test", timestamp=explicit)
+        assert msg_explicit.timestamp == explicit
+        assert msg_explicit.timestamp_iso() == "2025-11-04T10:00:00+00:00"
+        assert msg_explicit.timestamp_ns == int(explicit.timestamp()) * 1_000_000_000
+
+    def test_message_timestamp_is_memoized(self) -> None:
+        """Test that the lazily built timestamp is reused on later reads."""
+        msg = Message(topic="test")
+        first = msg.timestamp
+        assert msg.timestamp is first
+        assert msg.timestamp_iso() == first.isoformat()
+
+    def test_message_equality_and_copy(self) -> None:
+        """Test that messages compare by value and survive copying."""
+        import copy
+        import pickle
+
+        msg = Message(topic="test", data={"value": "test"}, correlation_id="cid-1")
+
+        assert copy.copy(msg) == msg
+        assert pickle.loads(pickle.dumps(msg)) == msg
+        assert msg != Message(topic="other", data={"value": "test"}, correlation_id="cid-1")
+
     def test_message_empty_topic_raises_error(self) -> None:
         """Test that empty topic raises SplurgePubSubValueError."""
         with pytest.raises(SplurgePubSubValueError):
@@ -144,6 +173,13 @@ class TestMessageImmutability:
         with pytest.raises(FrozenInstanceError):
             msg.data = "new_data"  # type: ignore
 
+    def test_message_uses_slots(self) -> None:
+        """Test that Message instances have no per-instance __dict__."""
+        msg = Message(topic="test", data={"key": "value"})
+
+        assert not hasattr(msg, "__dict__")
+        assert "topic" in Message.__slots__
+
 
 class TestMessageRepresentation:
     """Tests for Message string representation."""
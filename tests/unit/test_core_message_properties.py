@@ -140,7 +140,7 @@ class TestMessageImmutability:
         topic: Topic,
         data: MessageData,
     ) -> None:
-        """Test that Message instances are immutable (frozen dataclass)."""
+        """Test that Message instances are immutable."""
         message = Message(topic=topic, data=data)
 
         with pytest.raises((AttributeError, TypeError)):
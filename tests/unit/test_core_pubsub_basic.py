@@ -15,6 +15,9 @@ Test Cases:
 import concurrent.futures
 import threading
 import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any
 
 import pytest
@@ -28,6 +31,55 @@ from splurge_pub_sub import (
     SplurgePubSubValueError,
 )
 
+
+class _GatedQueue(deque[Message]):
+    """Message queue that can pause one emptiness check until the worker pops.
+
+    Once armed, the next ``len()`` (or truth test) made outside the worker
+    thread signals ``checking`` and blocks until the worker has popped a
+    message. This forces the worker to take the last message in the middle
+    of another thread's idle check.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.armed = False
+        self.checking = threading.Event()
+        self.popped = threading.Event()
+
+    def __len__(self) -> int:
+        if self.armed and threading.current_thread().name != "PubSub-Worker":
+            self.armed = False
+            self.checking.set()
+            self.popped.wait(timeout=5.0)
+        return super().__len__()
+
+    def popleft(self) -> Message:
+        message = super().popleft()
+        self.popped.set()
+        return message
+
+
+def _park_worker_with_queued_message(bus: PubSub, topic: str) -> _GatedQueue:
+    """Install a _GatedQueue on a fresh bus and leave one message queued for an idle worker.
+
+    Args:
+        bus: PubSub instance whose worker has not started yet
+        topic: Topic of the queued message; must have a subscriber
+
+    Returns:
+        The armed queue; the worker picks the message up on the next wakeup
+    """
+    queue = _GatedQueue()
+    bus._message_queue = queue
+    bus.publish(topic, {"warm_up": True})  # starts the worker
+    assert bus.drain()  # worker is idle and about to wait for a wakeup
+    queue.append(Message(topic=topic, correlation_id=bus.correlation_id))  # queued without waking the worker
+    queue.popped.clear()  # set by the warm-up message
+    queue.armed = True
+    return queue
+
+
 # ============================================================================
 # Initialization Tests
 # ============================================================================
@@ -54,6 +106,27 @@ class TestInitialization:
         bus = PubSub()
         assert bus.is_shutdown is False
 
+    def test_worker_thread_starts_on_first_publish(self) -> None:
+        """Test that the worker thread is only started once a message is enqueued."""
+        bus = PubSub()
+        bus.subscribe("topic", lambda msg: None)
+        assert bus._worker_thread is None
+
+        bus.publish("topic", {"data": "test"})
+        assert bus._worker_thread is not None
+        assert bus.drain() is True
+
+        bus.shutdown()
+        assert not bus._worker_thread.is_alive()
+
+    def test_shutdown_without_worker_thread(self) -> None:
+        """Test that a bus that never published shuts down cleanly."""
+        bus = PubSub()
+        assert bus.drain() is True
+        bus.shutdown()
+        assert bus._worker_thread is None
+        assert bus.is_shutdown is True
+
 
 # ============================================================================
 # Subscribe Tests
@@ -150,6 +223,109 @@ class TestSubscribe:
         with pytest.raises(SplurgePubSubRuntimeError):
             pubsub.subscribe("topic", callback)
 
+    def test_subscribe_keeps_bound_method_alive(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that a bound method of an otherwise unreferenced object stays subscribed."""
+        import gc
+
+        received: list[Message] = []
+
+        class Handler:
+            def on_event(self, msg: Message) -> None:
+                received.append(msg)
+
+        pubsub.subscribe("topic", Handler().on_event)
+        gc.collect()
+
+        pubsub.publish("topic", {"data": "test"})
+        pubsub.drain()
+        assert len(received) == 1
+
+    def test_subscriber_entries_have_no_instance_dict(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that subscriber entries use __slots__ rather than a per-instance __dict__."""
+        pubsub.subscribe("topic", lambda msg: None)
+
+        entry = pubsub.subscribers["topic"][0]
+        assert not hasattr(entry, "__dict__")
+
+    def test_subscribe_ids_are_unique_across_buses(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that subscriber IDs are sequence-based strings unique across buses."""
+        other = PubSub()
+        try:
+            ids = [pubsub.subscribe("topic", lambda msg: None) for _ in range(3)]
+            ids.append(other.subscribe("topic", lambda msg: None))
+
+            assert len(set(ids)) == len(ids)
+            assert all(isinstance(sub_id, str) and sub_id.startswith("sub-") for sub_id in ids)
+
+            # An ID from another bus never matches a subscriber on this one
+            with pytest.raises(SplurgePubSubLookupError):
+                pubsub.unsubscribe("topic", ids[-1])
+        finally:
+            other.shutdown()
+
+    def test_subscribe_interns_topic_key(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that plain str registry keys are interned so literal topics match by identity."""
+        import sys
+
+        received: list[Message] = []
+        dynamic_topic = "".join(["order", ".", "created"])
+        pubsub.subscribe(dynamic_topic, received.append)
+
+        (key,) = pubsub.subscribers.keys()
+        assert key is sys.intern("order.created")
+
+        pubsub.publish("order.created", {"id": 1})
+        pubsub.drain()
+        assert len(received) == 1
+
+    def test_subscribe_with_str_enum_topic(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that str-based Enum members work as topics (they cannot be interned)."""
+        import enum
+
+        class Topics(str, enum.Enum):
+            ORDER_CREATED = "order.created"
+
+        received: list[Message] = []
+        pubsub.subscribe(Topics.ORDER_CREATED, received.append)
+
+        (key,) = pubsub.subscribers.keys()
+        assert key is Topics.ORDER_CREATED
+
+        pubsub.publish(Topics.ORDER_CREATED, {"id": 1})
+        pubsub.drain()
+        assert len(received) == 1
+
+    def test_subscribers_properties_return_detached_copies(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that mutating returned subscriber lists does not affect dispatch."""
+        received: list[Message] = []
+        pubsub.subscribe("topic", received.append)
+        pubsub.subscribe("*", received.append)
+
+        pubsub.subscribers["topic"].clear()
+        pubsub.wildcard_subscribers.clear()
+
+        pubsub.publish("topic", {"data": "test"})
+        pubsub.drain()
+        assert len(received) == 2
+
 
 # ============================================================================
 # Publish Tests
@@ -319,6 +495,337 @@ class TestPublish:
         assert isinstance(received_messages[0], Message)
         assert received_messages[0].data == test_data
 
+    def test_publish_without_subscribers_skips_queue(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that publishing to a topic with no subscribers does not queue a message."""
+        pubsub.publish("nobody.listens", {"data": "test"}, correlation_id="custom-id")
+
+        assert pubsub._worker_thread is None
+        assert len(pubsub._message_queue) == 0
+        assert "custom-id" in pubsub.correlation_ids
+        assert pubsub.drain() is True
+
+        # Arguments are still validated
+        with pytest.raises(SplurgePubSubTypeError):
+            pubsub.publish("nobody.listens", "not a dict")  # type: ignore[arg-type]
+        with pytest.raises(SplurgePubSubValueError):
+            pubsub.publish("nobody..listens", {})
+
+    def test_publish_reaches_subscriber_added_by_pending_message(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that a topic subscribed by a still-queued message's callback receives later publishes."""
+        received: list[str] = []
+        gate = threading.Event()
+
+        def subscribe_follow_up(msg: Message) -> None:
+            gate.wait(timeout=5.0)
+            pubsub.subscribe("follow.up", lambda m: received.append(m.topic))
+
+        pubsub.subscribe("start", subscribe_follow_up)
+        pubsub.publish("start", {})
+        # "follow.up" has no subscribers yet, but "start" has not been handled
+        pubsub.publish("follow.up", {})
+        gate.set()
+        pubsub.drain()
+
+        assert received == ["follow.up"]
+
+    @pytest.mark.parametrize(
+        "send",
+        [
+            lambda bus: bus.publish("follow.up", {}),
+            lambda bus: bus._enqueue(Message(topic="follow.up", correlation_id=bus.correlation_id)),
+        ],
+        ids=["publish", "forwarded"],
+    )
+    def test_publish_reaches_subscriber_added_by_message_popped_during_check(
+        self,
+        pubsub: PubSub,
+        send: Callable[[PubSub], None],
+    ) -> None:
+        """Test that the zero-subscriber check is not fooled by the worker taking the last message mid-check."""
+        received: list[str] = []
+
+        def subscribe_follow_up(msg: Message) -> None:
+            if not msg.data.get("warm_up"):
+                pubsub.subscribe("follow.up", lambda m: received.append(m.topic))
+
+        pubsub.subscribe("start", subscribe_follow_up)
+        queue = _park_worker_with_queued_message(pubsub, "start")
+
+        publisher = threading.Thread(target=send, args=(pubsub,))
+        publisher.start()
+        assert queue.checking.wait(timeout=5.0)
+        pubsub._notify_worker()  # worker pops "start" while publish is checking
+        publisher.join(timeout=10.0)
+        assert pubsub.drain()
+
+        assert received == ["follow.up"]
+
+    def test_publish_shares_one_message_across_subscribers(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that every subscriber receives the same Message instance."""
+        received: list[Message] = []
+        for _ in range(5):
+            pubsub.subscribe("topic", received.append)
+        pubsub.subscribe("*", received.append)
+
+        pubsub.publish("topic", {"data": "test"})
+        pubsub.drain()
+
+        assert len(received) == 6
+        assert all(msg is received[0] for msg in received)
+
+    def test_publish_does_not_copy_data(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that the published data dict reaches subscribers without being copied."""
+        received: list[Message] = []
+        pubsub.subscribe("topic", received.append)
+        payload = {"data": "test"}
+
+        pubsub.publish("topic", payload)
+        pubsub.drain()
+
+        assert received[0].data is payload
+
+    def test_publish_never_runs_callbacks_inline(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that even a single subscriber runs on the worker thread, not the publisher's."""
+        callback_threads: list[threading.Thread] = []
+        release = threading.Event()
+
+        def slow_callback(msg: Message) -> None:
+            callback_threads.append(threading.current_thread())
+            release.wait(timeout=5.0)
+
+        pubsub.subscribe("topic", slow_callback)
+        pubsub.publish("topic", {})  # must return while the callback is blocked
+        release.set()
+        pubsub.drain()
+
+        assert len(callback_threads) == 1
+        assert callback_threads[0] is not threading.current_thread()
+
+    def test_publish_retained_messages_are_not_reused(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that messages kept by subscribers are distinct and unchanged by later publishes."""
+        retained: list[Message] = []
+        pubsub.subscribe("topic", retained.append)
+
+        for n in range(100):
+            pubsub.publish("topic", {"n": n})
+        pubsub.drain()
+
+        assert [msg.data["n"] for msg in retained] == list(range(100))
+        assert len({id(msg) for msg in retained}) == 100
+
+    def test_publish_from_callback_does_not_recurse(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that cascading publishes are queued rather than dispatched recursively."""
+        import sys
+
+        depth = sys.getrecursionlimit() * 2
+        received: list[int] = []
+
+        def relay(msg: Message) -> None:
+            step = msg.data["step"]
+            received.append(step)
+            if step < depth:
+                pubsub.publish("chain", {"step": step + 1})
+
+        pubsub.subscribe("chain", relay)
+        pubsub.publish("chain", {"step": 1})
+        assert pubsub.drain(timeout=10000)
+
+        assert received == list(range(1, depth + 1))
+
+    def test_publish_routes_follow_subscription_changes(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that cached routes are invalidated by subscribe, unsubscribe and clear."""
+        received: list[str] = []
+
+        pubsub.publish("topic", {"n": 1})  # caches an empty route
+        pubsub.drain()
+
+        pubsub.subscribe("topic", lambda msg: received.append("topic"))
+        wildcard_id = pubsub.subscribe("*", lambda msg: received.append("wildcard"))
+        pubsub.publish("topic", {"n": 2})
+        pubsub.drain()
+        assert received == ["topic", "wildcard"]
+
+        received.clear()
+        pubsub.unsubscribe("*", wildcard_id)
+        pubsub.publish("topic", {"n": 3})
+        pubsub.drain()
+        assert received == ["topic"]
+
+        received.clear()
+        pubsub.clear("topic")
+        pubsub.publish("topic", {"n": 4})
+        pubsub.drain()
+        assert received == []
+
+    def test_publish_and_dispatch_do_not_wait_for_registry_lock(
+        self,
+        pubsub: PubSub,
+        lock_holder: Callable[[Any], AbstractContextManager[None]],
+    ) -> None:
+        """Test that steady-state publish and dispatch do not contend on the lock."""
+        received: list[Message] = []
+        pubsub.subscribe("topic", received.append)
+        pubsub.publish("topic", {"n": 1})  # records the correlation_id and route
+        assert pubsub.drain()
+
+        # Hold the registry lock from another thread for the whole publish
+        with lock_holder(pubsub._lock):
+            pubsub.publish("topic", {"n": 2})
+            assert pubsub.drain(timeout=1000)
+            assert [msg.data["n"] for msg in received] == [1, 2]
+
+    def test_publish_route_cache_is_bounded(
+        self,
+        pubsub: PubSub,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the route cache evicts the oldest topics when full."""
+        import splurge_pub_sub.pubsub as pubsub_module
+
+        monkeypatch.setattr(pubsub_module, "_ROUTE_CACHE_MAX_SIZE", 3)
+        received: list[str] = []
+        pubsub.subscribe("*", lambda msg: received.append(msg.topic))
+
+        topics = [f"topic.{i}" for i in range(5)]
+        for topic in topics:
+            pubsub.publish(topic, {"data": "test"})
+        pubsub.drain()
+
+        assert received == topics
+        assert list(pubsub._route_cache) == topics[-3:]
+
+    def test_publish_routes_are_filtered_per_correlation_id(
+        self,
+        pubsub: PubSub,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that routes are cached per correlation_id and stay bounded per topic."""
+        import splurge_pub_sub.pubsub as pubsub_module
+
+        monkeypatch.setattr(pubsub_module, "_ROUTE_CACHE_MAX_CORRELATION_IDS", 2)
+        received: list[str] = []
+        pubsub.subscribe("topic", lambda msg: received.append("a"), correlation_id="cid-a")
+        pubsub.subscribe("topic", lambda msg: received.append("any"), correlation_id="*")
+        pubsub.subscribe("topic", lambda msg: received.append("b"), correlation_id="cid-b")
+
+        for cid in ["cid-a", "cid-b", "cid-c", "cid-a"]:
+            pubsub.publish("topic", {"data": "test"}, correlation_id=cid)
+        pubsub.drain()
+
+        assert received == ["a", "any", "any", "b", "any", "a", "any"]
+        assert len(pubsub._route_cache["topic"]) <= 2
+
+
+class TestPublishMany:
+    """Tests for publish_many() operation."""
+
+    def test_publish_many_delivers_in_order(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that a batch is delivered in the order given."""
+        received: list[Message] = []
+
+        pubsub.subscribe("*", received.append)
+        pubsub.publish_many(
+            [
+                ("topic.a", {"n": 1}),
+                ("topic.b", {"n": 2}),
+                ("topic.a", None),
+            ]
+        )
+        pubsub.drain()
+
+        assert [msg.topic for msg in received] == ["topic.a", "topic.b", "topic.a"]
+        assert [msg.data for msg in received] == [{"n": 1}, {"n": 2}, {}]
+
+    def test_publish_many_applies_metadata_and_correlation_id(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that metadata and correlation_id apply to every message."""
+        received: list[Message] = []
+
+        pubsub.subscribe("*", received.append, correlation_id="*")
+        pubsub.publish_many(
+            [("topic.a", {}), ("topic.b", {})],
+            metadata={"source": "batch"},
+            correlation_id="batch-id",
+        )
+        pubsub.drain()
+
+        assert len(received) == 2
+        assert all(msg.metadata == {"source": "batch"} for msg in received)
+        assert all(msg.correlation_id == "batch-id" for msg in received)
+        assert "batch-id" in pubsub.correlation_ids
+
+    def test_publish_many_invalid_entry_publishes_nothing(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that a batch with an invalid entry enqueues no messages."""
+        received: list[Message] = []
+
+        pubsub.subscribe("topic.a", received.append)
+
+        with pytest.raises(SplurgePubSubValueError):
+            pubsub.publish_many([("topic.a", {"n": 1}), ("", {"n": 2})])
+        with pytest.raises(SplurgePubSubTypeError):
+            pubsub.publish_many([("topic.a", {"n": 1}), ("topic.a", {1: "bad"})])
+        pubsub.drain()
+
+        assert received == []
+
+    @pytest.mark.parametrize("entry", [("topic.a",), ("topic.a", {}, None), "topic.a", None])
+    def test_publish_many_malformed_entry_raises_type_error(
+        self,
+        pubsub: PubSub,
+        entry: Any,
+    ) -> None:
+        """Test that an entry that is not a (topic, data) pair raises SplurgePubSubTypeError."""
+        received: list[Message] = []
+        pubsub.subscribe("topic.a", received.append)
+
+        with pytest.raises(SplurgePubSubTypeError, match="pairs"):
+            pubsub.publish_many([("topic.a", {"n": 1}), entry])
+        pubsub.drain()
+
+        assert received == []
+
+    def test_publish_many_after_shutdown_raises_error(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that publish_many on a shutdown bus raises error."""
+        pubsub.shutdown()
+
+        with pytest.raises(SplurgePubSubRuntimeError):
+            pubsub.publish_many([("topic", {})])
+
 
 # ============================================================================
 # Unsubscribe Tests
@@ -396,6 +903,21 @@ class TestUnsubscribe:
         assert len(received["cb1"]) == 1
         assert len(received["cb2"]) == 2
 
+    def test_unsubscribe_preserves_order_of_remaining_subscribers(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that removing a subscriber from the middle keeps subscription order."""
+        call_order: list[int] = []
+
+        sub_ids = [pubsub.subscribe("topic", lambda msg, i=i: call_order.append(i)) for i in range(5)]
+        pubsub.unsubscribe("topic", sub_ids[1])
+
+        pubsub.publish("topic", {})
+        pubsub.drain()
+
+        assert call_order == [0, 2, 3, 4]
+
 
 # ============================================================================
 # Clear Tests
@@ -811,6 +1333,56 @@ class TestDrain:
         result = pubsub.drain()
         assert result is True
 
+    def test_drain_waits_for_in_flight_message(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that drain does not return while a popped message is still being dispatched."""
+        started = threading.Event()
+        release = threading.Event()
+        received: list[Message] = []
+
+        def blocking_callback(msg: Message) -> None:
+            started.set()
+            release.wait(timeout=5.0)
+            received.append(msg)
+
+        pubsub.subscribe("topic", blocking_callback)
+        pubsub.publish("topic", {"data": "test"})
+        assert started.wait(timeout=5.0)
+
+        # Queue is empty but the message is in flight
+        assert pubsub.drain(timeout=50) is False
+
+        release.set()
+        assert pubsub.drain() is True
+        assert len(received) == 1
+
+    def test_drain_waits_for_message_popped_during_idle_check(
+        self,
+        pubsub: PubSub,
+    ) -> None:
+        """Test that drain does not return if the worker takes the last message mid-check."""
+        finished: list[Message] = []
+
+        def slow_callback(msg: Message) -> None:
+            time.sleep(0.1)
+            finished.append(msg)
+
+        pubsub.subscribe("topic", slow_callback)
+        queue = _park_worker_with_queued_message(pubsub, "topic")
+        finished.clear()
+
+        result: list[bool] = []
+        drainer = threading.Thread(target=lambda: result.append(pubsub.drain(timeout=5000)))
+        drainer.start()
+        assert queue.checking.wait(timeout=5.0)
+        pubsub._notify_worker()  # worker pops the message while drain is checking
+        drainer.join(timeout=10.0)
+
+        assert result == [True]
+        assert len(finished) == 1
+
     def test_drain_after_shutdown(
         self,
         pubsub: PubSub,
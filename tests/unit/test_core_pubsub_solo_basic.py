@@ -9,6 +9,7 @@ Test Cases:
     - Configuration parameters only applied on first call
     - is_initialized() and get_all_scopes()
     - All delegation methods (subscribe, publish, unsubscribe, clear, drain, shutdown, on)
+    - shutdown_all()
     - All delegation properties
     - Integration with PubSubAggregator
 """
@@ -178,6 +179,62 @@ class TestThreadSafety:
         instance_list = list(instances.values())
         assert len(set(id(inst) for inst in instance_list)) == 10
 
+    def test_get_instance_concurrent_with_shutdown(self) -> None:
+        """Test that get_instance() never fails while the scope is being shut down."""
+        errors: list[Exception] = []
+        stop = threading.Event()
+
+        def getter() -> None:
+            while not stop.is_set():
+                try:
+                    assert isinstance(PubSubSolo.get_instance(scope="racing_scope"), PubSub)
+                except Exception as e:  # pragma: no cover - only on failure
+                    errors.append(e)
+                    return
+
+        threads = [threading.Thread(target=getter) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for _ in range(50):
+            PubSubSolo.shutdown(scope="racing_scope")
+        stop.set()
+        for t in threads:
+            t.join()
+        PubSubSolo.shutdown(scope="racing_scope")
+
+        assert errors == []
+
+    def test_shutdown_concurrent_with_shutdown_all(self) -> None:
+        """Test that shutdown(scope=...) never fails while shutdown_all() clears the registry."""
+        errors: list[Exception] = []
+        stop = threading.Event()
+
+        def shutdown(scope: str) -> None:
+            while not stop.is_set():
+                try:
+                    # Publishing starts the worker, so shutdown() has to join it
+                    PubSubSolo.publish("race.topic", {}, scope=scope)
+                except SplurgePubSubRuntimeError:
+                    pass  # shutdown_all() got to this bus first
+                try:
+                    PubSubSolo.shutdown(scope=scope)
+                except Exception as e:  # pragma: no cover - only on failure
+                    errors.append(e)
+                    return
+
+        scopes = [f"shutdown_race_{i}" for i in range(4)]
+        threads = [threading.Thread(target=shutdown, args=(scope,)) for scope in scopes]
+        for t in threads:
+            t.start()
+        for _ in range(100):
+            PubSubSolo.shutdown_all()
+        stop.set()
+        for t in threads:
+            t.join()
+        PubSubSolo.shutdown_all()
+
+        assert errors == []
+
 
 # ============================================================================
 # Utility Methods Tests
@@ -264,6 +321,28 @@ class TestDelegationMethods:
 
         assert len(received) == 1
 
+    def test_publish_many_delegation(self) -> None:
+        """Test publish_many() delegation."""
+        # Reset all instances for clean test state
+        for scope in PubSubSolo.get_all_scopes():
+            PubSubSolo.shutdown(scope=scope)
+
+        received: list[Message] = []
+
+        def callback(msg: Message) -> None:
+            received.append(msg)
+
+        bus = PubSubSolo.get_instance(scope="publish_many_test")
+        bus.subscribe("test.topic", callback)
+
+        PubSubSolo.publish_many(
+            [("test.topic", {"n": 1}), ("test.topic", {"n": 2})],
+            scope="publish_many_test",
+        )
+        bus.drain()
+
+        assert [msg.data for msg in received] == [{"n": 1}, {"n": 2}]
+
     def test_unsubscribe_delegation(self) -> None:
         """Test unsubscribe() delegation."""
         # Reset all instances for clean test state
@@ -343,6 +422,20 @@ class TestDelegationMethods:
         assert bus.is_shutdown
         assert not PubSubSolo.is_initialized("shutdown_test")
 
+    def test_shutdown_all(self) -> None:
+        """Test shutdown_all() shuts down and removes every scope."""
+        bus_a = PubSubSolo.get_instance(scope="shutdown_all_a")
+        bus_b = PubSubSolo.get_instance(scope="shutdown_all_b")
+
+        PubSubSolo.shutdown_all()
+
+        assert bus_a.is_shutdown
+        assert bus_b.is_shutdown
+        assert PubSubSolo.get_all_scopes() == []
+        # A new instance can be created afterwards
+        assert PubSubSolo.get_instance(scope="shutdown_all_a") is not bus_a
+        PubSubSolo.shutdown_all()
+
     def test_on_delegation(self) -> None:
         """Test on() decorator delegation."""
         # Reset all instances for clean test state